@@ -1,6 +1,7 @@
 import os
 import re
-from setuptools import setup, find_packages
+from pathlib import Path
+from setuptools import setup
 import logging
 
 REPO_PATH = os.path.dirname(os.path.abspath(__file__))
@@ -8,26 +9,25 @@ VERSION_PATH = os.path.abspath(
     os.environ.get("VERSION_PATH", os.path.join(REPO_PATH, ".version"))
 )
 GITHUB_URL = "https://github.com/LamaAni/yapenv"
+_COMMENT_RE = re.compile(r"#[^\n]*")
 
-packages = find_packages()
+packages = ["yapenv", "yapenv.cli", "yapenv.commands"]
 
 
 # Get the long description from the README file
-with open(os.path.join(REPO_PATH, "README.md"), "r") as readme:
-    long_description = readme.read()
+long_description = Path(REPO_PATH, "README.md").read_text(encoding="utf-8")
 
-with open(os.path.join(REPO_PATH, "requirements.txt"), "r") as requirements_file:
-    requirements_text = requirements_file.read()
-    requirements_text = re.sub(r"[#].*", "", requirements_text)
-    requirement_list = [
-        r.strip() for r in requirements_text.split("\n") if len(r.strip()) > 0
-    ]
+requirements_text = _COMMENT_RE.sub(
+    "", Path(REPO_PATH, "requirements.txt").read_text(encoding="utf-8")
+)
+requirement_list = [
+    r.strip() for r in requirements_text.split("\n") if len(r.strip()) > 0
+]
 
 version = None
-if os.path.isfile(VERSION_PATH):
-    with open(VERSION_PATH, "r") as file:
-        version = file.read()
-else:
+try:
+    version = Path(VERSION_PATH).read_text()
+except FileNotFoundError:
     logging.info("Version file not found @ " + VERSION_PATH)
     logging.info("Using default version debug")
 
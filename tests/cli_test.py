@@ -1,3 +1,5 @@
+import os
+import shutil
 import tempfile
 from tests.consts import TEST_PATH
 from yapenv.cli import yapenv
@@ -31,6 +33,23 @@ def test_yapenv_cli_read_config_get():
         )
 
 
+def test_yapenv_cli_env_file_directory(tmp_path):
+    # A virtualenv named .env is not an env file, and is skipped.
+    env_dir = tmp_path / ".env"
+    env_dir.mkdir()
+    yapenv.main(
+        [
+            "config",
+            "get",
+            *CLI_COMMON_ARGS,
+            "--env-file",
+            str(env_dir),
+            "test_val",
+        ],
+        standalone_mode=False,
+    )
+
+
 def test_yapenv_cli_init():
     with tempfile.TemporaryDirectory() as temp_dir_path:
         yapenv.main(
@@ -43,34 +62,29 @@ def test_yapenv_cli_init():
         )
 
 
-def test_yapenv_cli_install():
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yapenv.main(
-            [
-                "install",
-                "--cwd",
-                temp_dir_path,
-            ],
-            standalone_mode=False,
-        )
+def test_yapenv_cli_install(tmp_path):
+    yapenv.main(
+        [
+            "install",
+            "--cwd",
+            str(tmp_path),
+        ],
+        standalone_mode=False,
+    )
+    assert os.path.isdir(os.path.join(str(tmp_path), ".venv"))
 
 
-def test_yapenv_cli_delete():
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yapenv.main(
-            [
-                "install",
-                "--cwd",
-                temp_dir_path,
-            ],
-            standalone_mode=False,
-        )
-        yapenv.main(
-            [
-                "delete",
-                "--force",
-                "--cwd",
-                temp_dir_path,
-            ],
-            standalone_mode=False,
-        )
+def test_yapenv_cli_delete(shared_venv_dir: str, tmp_path):
+    # Delete a copy, the shared venv is used by other tests.
+    venv_dir = str(tmp_path / "venv")
+    shutil.copytree(shared_venv_dir, venv_dir, symlinks=True)
+    yapenv.main(
+        [
+            "delete",
+            "--force",
+            "--cwd",
+            venv_dir,
+        ],
+        standalone_mode=False,
+    )
+    assert not os.path.exists(os.path.join(venv_dir, ".venv"))
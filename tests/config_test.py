@@ -1,9 +1,13 @@
 import re
 import os
+import tempfile
+import pytest
 from typing import List
 from tests.consts import TEST_PATH
 from yapenv.config import YAPENVConfig
 
+_VERSION_SPLIT_RE = re.compile(r"[=><]+")
+
 
 def test_yapenv_read_config(
     config: YAPENVConfig = None,
@@ -64,7 +68,9 @@ def test_yapenv_read_requirements(
     for package in packages:
         assert package in resolved_packages, "Package expected but not found " + package
 
-    resolved_package_names = [re.split(r"[=><]+", p)[0] for p in resolved_packages]
+    resolved_package_names = [
+        _VERSION_SPLIT_RE.split(p)[0] for p in resolved_packages
+    ]
     assert len(set(resolved_package_names)) == len(
         resolved_package_names
     ), "Invalid package resolve, duplicate packages exist"
@@ -86,3 +92,114 @@ def test_yapenv_read_requirements_in_env():
             "click",
         ],
     )
+
+
+def test_yapenv_config_cache_invalidation():
+    with tempfile.TemporaryDirectory() as temp_dir_path:
+        config_path = os.path.join(temp_dir_path, ".yapenv.yaml")
+        with open(config_path, "w") as config_file:
+            config_file.write("test_val: first\n")
+        assert YAPENVConfig.load(temp_dir_path).find("test_val")[0] == "first"
+
+        with open(config_path, "w") as config_file:
+            config_file.write("test_val: second\n")
+        assert YAPENVConfig.load(temp_dir_path).find("test_val")[0] == "second"
+
+
+def test_yapenv_config_cache_invalidation_on_new_imports():
+    with tempfile.TemporaryDirectory() as temp_dir_path:
+        with open(os.path.join(temp_dir_path, ".yapenv.yaml"), "w") as config_file:
+            config_file.write("a: 1\nimport:\n  - extra/*.yaml\n  - opt.yaml\n")
+        os.makedirs(os.path.join(temp_dir_path, "extra"))
+        assert YAPENVConfig.load(temp_dir_path).find("a", "b", "o") == [1]
+
+        # New glob match and new optional import.
+        with open(os.path.join(temp_dir_path, "extra", "b.yaml"), "w") as config_file:
+            config_file.write("b: 2\n")
+        with open(os.path.join(temp_dir_path, "opt.yaml"), "w") as config_file:
+            config_file.write("o: 3\n")
+        assert YAPENVConfig.load(temp_dir_path).find("a", "b", "o") == [1, 2, 3]
+
+
+def test_yapenv_config_cache_changed_while_parsing(monkeypatch):
+    import yapenv.config
+
+    read_config_file = yapenv.config.read_config_file
+    with tempfile.TemporaryDirectory() as temp_dir_path:
+        config_path = os.path.join(temp_dir_path, ".yapenv.yaml")
+        with open(config_path, "w") as config_file:
+            config_file.write("x: 1\n")
+
+        def read_and_change(fpath, *args, **kwargs):
+            parsed = read_config_file(fpath, *args, **kwargs)
+            if fpath == config_path:
+                with open(config_path, "w") as config_file:
+                    config_file.write("x: 22\n")
+            return parsed
+
+        with monkeypatch.context() as patch:
+            patch.setattr(yapenv.config, "read_config_file", read_and_change)
+            assert YAPENVConfig.load(temp_dir_path).find("x") == [1]
+
+        # The change (while parsing) invalidates the cached config.
+        assert YAPENVConfig.load(temp_dir_path).find("x") == [22]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="No user ids")
+def test_yapenv_config_cache_not_private(monkeypatch, tmp_path):
+    import yapenv.config
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    monkeypatch.setattr(yapenv.config, "YAPENV_CACHE_DIR", str(cache_dir))
+    key = ("test_yapenv_config_cache_not_private",)
+    yapenv.config.write_cached_config(key, YAPENVConfig({"x": 1}), ())
+    yapenv.config._LOADED_CONFIG_CACHE.pop(key)
+    assert yapenv.config.read_cached_config(key).find("x") == [1]
+
+    # Shared (writable by others) cache dirs or files are not unpickled.
+    yapenv.config._LOADED_CONFIG_CACHE.pop(key)
+    cache_dir.chmod(0o777)
+    assert yapenv.config.read_cached_config(key) is None
+    cache_dir.chmod(0o700)
+    os.chmod(yapenv.config.get_config_cache_filepath(key), 0o666)
+    assert yapenv.config.read_cached_config(key) is None
+
+
+def test_yapenv_package_exports():
+    import yapenv
+
+    namespace = {}
+    exec("from yapenv import *", namespace)
+    for name in ["yapenv_cli", "YAPENVConfig", "YAPENVConfigRequirement"]:
+        assert name in namespace, "Missing star export " + name
+        assert name in dir(yapenv), "Missing dir entry " + name
+
+
+def test_yapenv_config_find_many():
+    config = YAPENVConfig({"a": {"b": [1, {"c": 2}]}, "l": [1]})
+    found = config.find_many(["a.b[0]", "a.b[1].c", "a.x", "a.b[5]", "x.y", "", "l"])
+    # Missing paths (and empty paths) are skipped.
+    assert found == [1, 2, [1]]
+
+
+def test_yapenv_config_find_many_differs_from_find():
+    config = YAPENVConfig({"d": {"x": {"y": 1}}, "l": list(range(11))})
+    # Trailing empty parts are ignored (find skips these paths).
+    assert config.find_many(["d.x.y."]) == [1]
+    assert config.find("d.x.y.") == []
+    # The full list index is used (find reads only the first digit).
+    assert config.find_many(["l[10]"]) == [10]
+    assert config.find("l[10]") == [1]
+
+
+def test_yapenv_config_find_many_invalid_index():
+    with pytest.raises(AssertionError, match="Invalid item path part"):
+        YAPENVConfig({"a": [1]}).find_many(["a[]"])
+
+
+def test_yapenv_config_find_many_type_mismatch():
+    config = YAPENVConfig({"a": {"b": 1}, "l": [1]})
+    for path in ["a[0]", "l.x", "a.b.c"]:
+        with pytest.raises(AssertionError):
+            config.find_many([path])
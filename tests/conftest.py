@@ -0,0 +1,33 @@
+import os
+import atexit
+import shutil
+import tempfile
+import pytest
+
+# Keep the config cache of the test session out of the user cache directory
+# (must be set before yapenv is imported).
+os.environ["YAPENV_CACHE_DIR"] = tempfile.mkdtemp(prefix="yapenv-test-cache-")
+atexit.register(shutil.rmtree, os.environ["YAPENV_CACHE_DIR"], ignore_errors=True)
+
+import yapenv.commands as yapenv_commands  # noqa: E402
+from yapenv.config import YAPENVConfig  # noqa: E402
+
+TESTS_PATH = os.path.dirname(__file__)
+
+# Reuse the pip cache (and optional pre-built wheels) across test sessions, e.g.
+# pip wheel --wheel-dir tests/.pip-wheels -r requirements.txt
+os.environ.setdefault("PIP_CACHE_DIR", os.path.join(TESTS_PATH, ".pip-cache"))
+YAPENV_TEST_WHEEL_DIR = os.environ.get(
+    "YAPENV_TEST_WHEEL_DIR", os.path.join(TESTS_PATH, ".pip-wheels")
+)
+if os.path.isdir(YAPENV_TEST_WHEEL_DIR):
+    os.environ.setdefault("PIP_FIND_LINKS", YAPENV_TEST_WHEEL_DIR)
+
+
+@pytest.fixture(scope="session")
+def shared_venv_dir(tmp_path_factory: pytest.TempPathFactory):
+    """A source directory with an installed virtual environment, shared by the delete
+    tests (which delete a copy)"""
+    venv_dir = str(tmp_path_factory.mktemp("venv"))
+    yapenv_commands.install(YAPENVConfig.load(venv_dir), reset=True, force=True)
+    return venv_dir
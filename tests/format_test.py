@@ -0,0 +1,25 @@
+import pytest
+from bole.format import PrintFormat, get_print_formatted as bole_get_print_formatted
+from yapenv.format import get_print_formatted, iter_print_formatted
+
+
+@pytest.mark.parametrize("format", list(PrintFormat))
+@pytest.mark.parametrize("val", [{"a": [1, "b c"]}, ["a b", {"c": 1}], []])
+def test_print_formatted_same_as_bole(format: PrintFormat, val):
+    assert get_print_formatted(format, val) == bole_get_print_formatted(format, val)
+
+
+def test_iter_print_formatted_iterables():
+    def values():
+        yield "a b"
+        yield 1
+
+    assert "".join(iter_print_formatted(PrintFormat.list, values())) == "a b\n1"
+    assert "".join(iter_print_formatted(PrintFormat.cli, values())) == "'a b' 1"
+    assert "".join(iter_print_formatted(PrintFormat.json, values())) == '["a b", 1]'
+    assert "".join(iter_print_formatted(PrintFormat.yaml, values())) == "- a b\n- 1\n"
+
+
+def test_iter_print_formatted_no_quote():
+    chunks = iter_print_formatted(PrintFormat.cli, {"--opt": "a b"}, quote_cli=False)
+    assert "".join(chunks) == "--opt a b"
@@ -0,0 +1,17 @@
+import os
+from yapenv.loader import load_env_file
+
+
+def test_load_env_file_existing_envs_win(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("YAPENV_TEST_A=file\nYAPENV_TEST_B=${YAPENV_TEST_A}\n")
+    monkeypatch.setenv("YAPENV_TEST_A", "shell")
+    # Set first, so the value loaded into os.environ is removed on teardown.
+    monkeypatch.setenv("YAPENV_TEST_B", "")
+    monkeypatch.delenv("YAPENV_TEST_B")
+
+    load_env_file(str(env_file))
+
+    # Same as load_dotenv (override=False), the existing env is used.
+    assert os.environ["YAPENV_TEST_A"] == "shell"
+    assert os.environ["YAPENV_TEST_B"] == "shell"
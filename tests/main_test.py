@@ -0,0 +1,113 @@
+import os
+import importlib
+import pytest
+import yapenv.cli
+import yapenv.commands as yapenv_commands
+from yapenv.__main__ import run_cli_main
+from yapenv.commands.shell import handover
+from yapenv.config import YAPENVConfig
+
+
+class Handover(BaseException):
+    """Raised instead of replacing the test process (not caught by the cli)"""
+
+
+@pytest.fixture
+def handovers(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """Run the cli in a source directory (config, env file and venv folder) and
+    record the handovers (config, cwd and exec args) instead of replacing the
+    process."""
+    (tmp_path / ".yapenv.yaml").write_text(
+        "venv_directory: venv\nenv_file: .env\ntest_val: source\n"
+    )
+    (tmp_path / ".env").write_text("YAPENV_TEST_MAIN=env_file\n")
+    (tmp_path / "venv" / "bin").mkdir(parents=True)
+    # Set first, so the value loaded into os.environ is removed on teardown.
+    monkeypatch.setenv("YAPENV_TEST_MAIN", "")
+    monkeypatch.delenv("YAPENV_TEST_MAIN")
+
+    calls = []
+    handover = yapenv_commands.handover
+
+    def record_handover(config: YAPENVConfig, *command, **kwargs):
+        calls.append({"config": config.to_dictionary()})
+        handover(config, *command, **kwargs)
+
+    def record_exec(*args):
+        calls[-1].update(cwd=os.getcwd(), exec_args=args)
+        raise Handover()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SHELL", "/bin/sh")
+    # The shell command calls its module handover.
+    shell_module = importlib.import_module("yapenv.commands.shell")
+    for module in [yapenv_commands, shell_module]:
+        monkeypatch.setattr(module, "handover", record_handover)
+    # Activating the venv changes the test process (envs, sys.path).
+    monkeypatch.setattr(YAPENVConfig, "load_virtualenv", lambda self: None)
+    for name in ["execv", "execve", "execvpe"]:
+        monkeypatch.setattr(os, name, record_exec)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["shell"], ["run", "python", "setup.py"], ["requirements", "freeze"]],
+)
+def test_fast_dispatch_same_as_cli(
+    handovers: list, monkeypatch: pytest.MonkeyPatch, args
+):
+    with monkeypatch.context() as fast_only:
+        fast_only.setattr(yapenv.cli, "run_cli_main", pytest.fail)
+        with pytest.raises(Handover):
+            run_cli_main(args)
+    with pytest.raises(Handover):
+        yapenv.cli.run_cli_main(args)
+
+    fast, cli = handovers
+    assert fast == cli
+    assert fast["config"]["test_val"] == "source"
+    assert fast["cwd"] == os.path.realpath(os.curdir)
+    assert os.environ["YAPENV_TEST_MAIN"] == "env_file"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["shell", "-k"],
+        ["run", "python", "-V"],
+        ["run", "--keep-current-directory", "python"],
+        ["requirements", "freeze", "--cwd", "."],
+    ],
+)
+def test_fast_dispatch_options_use_cli(
+    handovers: list, monkeypatch: pytest.MonkeyPatch, args
+):
+    cli_calls = []
+    monkeypatch.setattr(yapenv.cli, "run_cli_main", cli_calls.append)
+    run_cli_main(args)
+    assert cli_calls == [args]
+    assert handovers == []
+
+
+@pytest.mark.parametrize("env", [None, {}])
+def test_handover_empty_env_inherits(monkeypatch: pytest.MonkeyPatch, tmp_path, env):
+    (tmp_path / ".yapenv.yaml").write_text("venv_directory: venv\n")
+    (tmp_path / "venv").mkdir()
+    config = YAPENVConfig.load(str(tmp_path))
+
+    execs = []
+
+    def record_exec(name: str):
+        return lambda *args: execs.append((name, args))
+
+    for name in ["execv", "execve", "execvpe"]:
+        monkeypatch.setattr(os, name, record_exec(name))
+    # The handover changes to the source directory.
+    monkeypatch.chdir(tmp_path)
+    handover(config, "/bin/sh", "-c", "true", env=env)
+    handover(config, "sh", env=env)
+
+    # An empty env inherits the process envs (same as no env).
+    assert [name for name, _ in execs] == ["execv", "execvpe"]
+    assert execs[1][1][2] is os.environ
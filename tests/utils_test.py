@@ -0,0 +1,70 @@
+import io
+import pytest
+from yapenv.config import YAPENVConfig
+from yapenv.commands.pip import pip_command_args
+from yapenv.utils import (
+    clean_data_types,
+    confirm,
+    deep_merge_dicts,
+    quote_no_expand_args,
+    read_file_bytes,
+    run_shell_command,
+)
+
+
+def test_run_shell_command_expand_args(monkeypatch, capfd):
+    monkeypatch.setenv("YAPENV_TEST_EXTRA", "extra.txt")
+    args = ["a  b", " -r $YAPENV_TEST_EXTRA --pre"]
+    assert quote_no_expand_args(*args) == ["'a  b'", " -r $YAPENV_TEST_EXTRA --pre"]
+
+    # Args with a leading space are split and expanded by the shell.
+    run_shell_command("echo", *args, expand_args=True)
+    assert capfd.readouterr().out == "a  b -r extra.txt --pre\n"
+
+
+def test_pip_command_args_no_shell():
+    config = YAPENVConfig({"pip_install_args": [" -r extra.txt"], "requirements": []})
+    assert pip_command_args(config, quote=False) == ["install", " -r extra.txt"]
+
+
+def test_confirm_eof_raises(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+    with pytest.raises(EOFError):
+        confirm("Create? (y/n) ")
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
+    assert confirm("Create? (y/n) ")
+
+
+def test_read_file_bytes_grown_file(tmp_path):
+    fpath = tmp_path / "grown.yaml"
+    fpath.write_bytes(b"a: 1\nb: 2\n")
+    # The size is only the first read size (e.g. the file grew since the stat).
+    assert read_file_bytes(str(fpath), 4) == b"a: 1\nb: 2\n"
+    assert read_file_bytes(str(fpath)) == b"a: 1\nb: 2\n"
+
+
+def test_deep_merge_dicts():
+    target = {"a": {"x": 1, "l": [1]}, "b": 1}
+    merged = deep_merge_dicts(
+        target,
+        {"a": {"x": 2, "l": [2]}, "b": [1]},
+        {"a": {"l": [3], "y": {"z": 1}}, "c": {"d": 1}},
+        {"a": {"x": 3}, "c": 2},
+    )
+
+    # Merged in place, later sources win and lists are concatenated in order.
+    assert merged is target
+    assert merged == {"a": {"x": 3, "l": [1, 2, 3], "y": {"z": 1}}, "b": [1], "c": 2}
+
+
+def test_clean_data_types():
+    assert clean_data_types({1: (1, "a"), "n": None, "d": {"t": (True, 1.5)}}) == {
+        "1": [1, "a"],
+        "n": None,
+        "d": {"t": [True, 1.5]},
+    }
+    config = YAPENVConfig({"a": [{"b": ("c",)}]})
+    cleaned = clean_data_types(config)
+    assert cleaned == {"a": [{"b": ["c"]}]}
+    assert type(cleaned) is dict
@@ -1,7 +1,14 @@
+import os
+import sys
+import importlib
+import shutil
+import subprocess
 import tempfile
 import yapenv.commands as yapenv_commands
 from yapenv.config import YAPENVConfig
 
+REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def test_init():
     with tempfile.TemporaryDirectory() as temp_dir_path:
@@ -9,14 +16,84 @@ def test_init():
         yapenv_commands.init(config)
 
 
-def test_install():
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        config = YAPENVConfig.load(temp_dir_path)
-        yapenv_commands.install(config, reset=True, force=True)
+def test_install(tmp_path):
+    config = YAPENVConfig.load(str(tmp_path))
+    assert not config.has_virtual_environment()
+    yapenv_commands.install(config)
+    assert config.has_virtual_environment()
+    # Created by install, the venv files are updated with their signature.
+    assert os.path.isfile(config.resolve_from_venv_directory(".yapenv_files.hash"))
 
 
-def test_delete():
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        config = YAPENVConfig.load(temp_dir_path)
-        yapenv_commands.install(config, reset=True, force=True)
-        yapenv_commands.delete(config, force=True)
+def test_delete(shared_venv_dir: str, tmp_path):
+    # Delete a copy, the shared venv is used by other tests.
+    venv_dir = str(tmp_path / "venv")
+    shutil.copytree(shared_venv_dir, venv_dir, symlinks=True)
+    config = YAPENVConfig.load(venv_dir)
+    assert config.has_virtual_environment()
+    yapenv_commands.delete(config, force=True)
+    assert not config.has_virtual_environment()
+
+
+def test_update_files_skipped_if_up_to_date(tmp_path, monkeypatch):
+    (tmp_path / ".yapenv.yaml").write_text("venv_directory: venv\n")
+    (tmp_path / "venv" / "bin").mkdir(parents=True)
+    virtualenv_module = importlib.import_module("yapenv.commands.virtualenv")
+    copies = []
+    copy_shell_activation = virtualenv_module.virtualenv_copy_shell_activation
+    monkeypatch.setattr(
+        virtualenv_module,
+        "virtualenv_copy_shell_activation",
+        lambda config: copies.append(copy_shell_activation(config)),
+    )
+
+    config = YAPENVConfig.load(str(tmp_path))
+    yapenv_commands.virtualenv_update_files(config)
+    assert len(copies) == 1
+    yapenv_commands.virtualenv_update_files(config)
+    assert len(copies) == 1
+    yapenv_commands.virtualenv_update_files(config, force=True)
+    assert len(copies) == 2
+
+    # Changed inputs (the pip config) are updated.
+    (tmp_path / "pip.conf").write_text("[global]\n")
+    config["pip_config_path"] = "pip.conf"
+    yapenv_commands.virtualenv_update_files(config)
+    assert len(copies) == 3
+    assert os.path.islink(config.resolve_from_venv_directory("pip.conf"))
+
+    # A deleted pip.conf link is restored.
+    os.remove(config.resolve_from_venv_directory("pip.conf"))
+    yapenv_commands.virtualenv_update_files(config)
+    assert len(copies) == 4
+    assert os.path.islink(config.resolve_from_venv_directory("pip.conf"))
+
+
+def test_load_virtualenv_switch(tmp_path):
+    # Activating venvs changes the process envs, run in a separate process.
+    venv_dirs = [str(tmp_path / "a"), str(tmp_path / "b")]
+    for venv_dir in venv_dirs:
+        subprocess.run(
+            [sys.executable, "-m", "virtualenv", "-q", "--no-pip", "--no-wheel"]
+            + ["--no-setuptools", os.path.join(venv_dir, ".venv")],
+            check=True,
+        )
+
+    script = "\n".join(
+        [
+            "import os, sys",
+            "from yapenv.config import YAPENVConfig",
+            "a, b = (YAPENVConfig.load(p) for p in sys.argv[1:])",
+            "for config in (a, b, a):",
+            "    config.load_virtualenv()",
+            "print(os.environ['VIRTUAL_ENV'])",
+        ]
+    )
+    rslt = subprocess.run(
+        [sys.executable, "-c", script, *venv_dirs],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": REPO_PATH},
+    )
+    assert rslt.stdout.strip() == os.path.join(venv_dirs[0], ".venv")
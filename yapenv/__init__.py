@@ -1,2 +1,28 @@
-from yapenv.cli import yapenv as yapenv_cli  # noqa
-from yapenv.config import *  # noqa
+def _get_exports():
+    """The names exported by the package (yapenv_cli and the yapenv.config exports)"""
+    import yapenv.config
+
+    return ["yapenv_cli", *(n for n in dir(yapenv.config) if not n.startswith("_"))]
+
+
+def __getattr__(name: str):
+    # The cli and config exports are loaded on first access (faster cli startup).
+    if name == "yapenv_cli":
+        from yapenv.cli import yapenv as yapenv_cli
+
+        return yapenv_cli
+
+    if name == "__all__":
+        # Used by "from yapenv import *".
+        return _get_exports()
+
+    import yapenv.config
+
+    try:
+        return getattr(yapenv.config, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    return sorted({*globals(), *_get_exports()})
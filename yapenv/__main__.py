@@ -1,13 +1,88 @@
-# flake8: noqa
 import os
+import sys
+from typing import Callable, Dict, List
 
-ENTRY_ENVS = os.environ.copy()
 
-from yapenv import consts  # noqa
+def _load_default_config():
+    """Load the config as a cli command with no options would (the fast commands
+    do not use the requirements)"""
+    from yapenv.loader import load_config
 
-consts.ENTRY_ENVS = ENTRY_ENVS
+    return load_config(os.path.realpath(os.curdir), import_requirements=False)
+
+
+def _fast_version(args: List[str]) -> bool:
+    if len(args) > 0:
+        return False
+    from yapenv.consts import YAPENV_VERSION
+
+    print(YAPENV_VERSION)
+    return True
+
+
+def _fast_shell(args: List[str]) -> bool:
+    if len(args) > 0:
+        return False
+    import yapenv.commands as yapenv_commands
+
+    yapenv_commands.shell(_load_default_config(), use_source_dir=True)
+    return True
+
+
+def _fast_run(args: List[str]) -> bool:
+    # Any option (or --) may be parsed by click, even after the command.
+    if len(args) == 0 or any(a.startswith("-") for a in args):
+        return False
+    import yapenv.commands as yapenv_commands
+
+    config = _load_default_config()
+    config.load_virtualenv()
+    yapenv_commands.handover(config, *args, use_source_dir=True)
+    return True
+
+
+def _fast_requirements(args: List[str]) -> bool:
+    if args != ["freeze"]:
+        return False
+    import yapenv.commands as yapenv_commands
+
+    config = _load_default_config()
+    config.load_virtualenv()
+    yapenv_commands.handover(config, "pip", "freeze", use_source_dir=True)
+    return True
+
+
+_FAST_DISPATCH: Dict[str, Callable[[List[str]], bool]] = {
+    "version": _fast_version,
+    "shell": _fast_shell,
+    "run": _fast_run,
+    "requirements": _fast_requirements,
+}
+"""Commands that are run without loading the cli (click), when called with no
+options. A handler returns False if the args must be parsed by the cli."""
+
+
+def run_cli_main(args: List[str] = None):
+    """The yapenv cli entry point. Simple invocations of the hot commands
+    (see _FAST_DISPATCH) skip loading the cli."""
+    argv = sys.argv[1:] if args is None else list(args)
+    fast_command = _FAST_DISPATCH.get(argv[0]) if len(argv) > 0 else None
+    if fast_command is not None:
+        try:
+            if fast_command(argv[1:]):
+                return
+        except Exception as ex:
+            if os.environ.get("YAPENV_FULL_ERRORS", "false").lower() == "true":
+                raise ex
+            from yapenv.log import yapenv_log
+
+            yapenv_log.error(ex)
+            sys.exit(1)
+
+    from yapenv.cli import run_cli_main
+
+    run_cli_main(args)
 
-from yapenv.cli import run_cli_main  # noqa
 
 if __name__ == "__main__":
     run_cli_main()
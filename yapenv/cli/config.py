@@ -4,7 +4,6 @@ from typing import List
 from bole.format import PrintFormat
 from yapenv.cli.options import CommonOptions, FormatOptions
 from yapenv.cli.core import yapenv
-from yapenv.utils import clean_data_types
 
 
 @yapenv.group("config", help="Env configuration values")
@@ -19,6 +18,8 @@ def get_config_values(
     allow_missing: bool = False,
     **kwargs,
 ):
+    from yapenv.utils import clean_data_types
+
     config = CommonOptions(kwargs).load(import_requirements=resolve)
     rslt = None
     was_found = False
@@ -28,7 +29,7 @@ def get_config_values(
         was_found = True
     else:
         # Search for paths in the config
-        rslt = config.find(*dict_paths)
+        rslt = config.find_many(dict_paths)
         # Clean the values from custom python types
         rslt = [clean_data_types(v) for v in rslt]
         was_found = len(rslt) > 0
@@ -71,7 +72,7 @@ def print_config_values(
     if not isinstance(to_display, list) and not isinstance(to_display, dict):
         print(str(to_display))  # Not a list or dict, don't format output.
     else:
-        print(FormatOptions(kwargs).print(to_display))
+        FormatOptions(kwargs).write(to_display)
 
 
 @config.command(
@@ -1,14 +1,13 @@
 import os
+import sys
 from typing import List
 import click
 from yapenv.cli.options import CommonOptions
-from yapenv.consts import YAPENV_VERSION
+from yapenv.consts import YAPENV_GROUP_HELP, YAPENV_VERSION
 from yapenv.log import yapenv_log
 
 
-@click.group(
-    help=f"""Yet Another Python Environment manager (version: {YAPENV_VERSION})"""
-)
+@click.group(help=YAPENV_GROUP_HELP)
 def yapenv():
     pass
 
@@ -19,23 +18,19 @@ def version():
 
 
 def run_cli_main(args: List[str] = None):
-    import sys
-
-    if "--full-errors" in sys.argv:
+    # The env var is checked first, skipping the args scan.
+    if os.environ.get("YAPENV_FULL_ERRORS", "false").lower() == "true" or (
+        "--full-errors" in (sys.argv if args is None else args)
+    ):
         CommonOptions.SHOW_FULL_ERRORS = True
 
     try:
         if args is None:
             yapenv()
         else:
-            args = list(args)
             yapenv.main(args)
 
     except Exception as ex:
-        if CommonOptions.SHOW_FULL_ERRORS is None:
-            CommonOptions.SHOW_FULL_ERRORS = (
-                os.environ.get("YAPENV_FULL_ERRORS", "false").lower() == "true"
-            )
         if CommonOptions.SHOW_FULL_ERRORS:
             raise ex
         else:
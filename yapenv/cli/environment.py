@@ -1,13 +1,10 @@
-import json
 import sys
 import click
 from typing import List
 
-import yapenv.commands as yapenv_commands
 from yapenv.cli.options import CommonOptions
 from yapenv.cli.core import yapenv
 from yapenv.log import yapenv_log
-from yapenv.utils import deep_merge
 
 
 @yapenv.command("delete", help="Delete the virtual environment installation")
@@ -16,7 +13,9 @@ from yapenv.utils import deep_merge
 )
 @CommonOptions.decorator()
 def delete(force: bool = False, **kwargs):
-    config = CommonOptions(kwargs).load()
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
     yapenv_commands.delete(config, force=force)
 
 
@@ -39,6 +38,8 @@ def install(
     force: bool = False,
     **kwargs,
 ):
+    import yapenv.commands as yapenv_commands
+
     config = CommonOptions(kwargs).load()
     yapenv_commands.install(
         config,
@@ -103,19 +104,26 @@ def init(
     set_config_args: List[str] = [],
     **kwargs,
 ):
+    import json
+    import yapenv.commands as yapenv_commands
+    from yapenv.utils import deep_merge_dicts
+
     python_version = (
         python_version
         if python_version is not None and len(python_version) > 0
         else None
     )
 
-    # parse config args
-    merge_dicts = []
+    # parse config args (merged in place, the parsed dicts are not shared)
+    merge_with = {}
+    decoder = json.JSONDecoder()
     for arg in set_config_args:
+        if len(arg.strip()) == 0:
+            continue
         try:
-            merge_dict = json.loads(arg)
+            merge_dict = decoder.decode(arg)
             assert isinstance(merge_dict, dict), "Not a dictionary"
-            merge_dicts.append(merge_dict)
+            deep_merge_dicts(merge_with, merge_dict)
             yapenv_log.info("Merging with args from " + arg)
 
         except Exception as ex:
@@ -146,12 +154,13 @@ def init(
         python_version=python_version,
         config_filename=config_filename,
         add_requirement_files=not no_requirement_files,
-        merge_with=deep_merge({}, *merge_dicts),
+        merge_with=merge_with,
     )
 
     if not no_install:
-        # Reload config
-        config = CommonOptions(kwargs).load(import_requirements=True)
+        # Reload config (with the environment and inherit depth). Only the written
+        # config file is parsed again, other files and env files are cached.
+        config = options.load(import_requirements=True)
 
         # Update the venv files.
         if not reset and config.has_virtual_environment():
@@ -1,124 +1,73 @@
 import os
-from typing import Union
+import sys
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Union
 import click
-from bole.format import PrintFormat, get_print_formatted
-from dotenv import load_dotenv
-from yapenv.consts import YAPENV_CONFIG_FILES
-from yapenv.log import yapenv_log
-from yapenv.config import YAPENVConfig
+from bole.format import PrintFormat
 from yapenv.utils import resolve_path
 
+if TYPE_CHECKING:
+    from yapenv.config import YAPENVConfig
 
-class CommonOptions(dict):
-    SHOW_FULL_ERRORS = None
+_WRITE_BATCH_SIZE = 1 << 16
+"""The max number of chars to collect before writing formatted output"""
 
-    @property
-    def cwd(self) -> str:
-        return self.get("cwd", None)
 
-    @property
-    def environment(self) -> str:
-        return self.get("env", None)
+class CommonOptions:
+    """The common cli options, read from the command kwargs"""
 
-    @property
-    def inherit_depth(self) -> int:
-        return self.get("inherit_depth", None)
+    __slots__ = (
+        "cwd",
+        "environment",
+        "inherit_depth",
+        "ignore_missing_env",
+        "env_file",
+        "extra_config_file",
+    )
 
-    @property
-    def ignore_missing_env(self) -> bool:
-        return self.get("ignore_missing_env", False)
+    SHOW_FULL_ERRORS = None
 
-    @property
-    def env_file(self) -> str:
-        return self.get("env_file", os.environ.get("YAPENV_ENV_FILE", ".env"))
+    def __init__(self, kwargs: Dict[str, Any] = {}):
+        self.cwd: str = kwargs.get("cwd", None)
+        self.environment: str = kwargs.get("env", None)
+        self.inherit_depth: int = kwargs.get("inherit_depth", None)
+        self.ignore_missing_env: bool = kwargs.get("ignore_missing_env", False)
+        self.env_file: str = (
+            kwargs["env_file"]
+            if "env_file" in kwargs
+            else os.environ.get("YAPENV_ENV_FILE", ".env")
+        )
+        self.extra_config_file: List[str] = list(kwargs.get("extra_config_file", []))
 
     @property
-    def extra_config_file(self) -> str:
-        return list(self.get("extra_config_file", []))
+    def env_file_path(self) -> str:
+        """The absolute env file path (click already resolves the cli value)"""
+        env_file = self.env_file
+        return env_file if os.path.isabs(env_file) else resolve_path(env_file)
 
     def load(
         self,
         import_requirements: bool = True,
         ignore_environment: bool = False,
         inherit_depth: int = None,
-    ) -> YAPENVConfig:
-        env_file = resolve_path(self.env_file)
-        if os.path.isfile(env_file):
-            yapenv_log.debug("Loading environment variables from: " + env_file)
-            load_dotenv(env_file)
+    ) -> "YAPENVConfig":
+        from yapenv.loader import load_config
 
-        config = YAPENVConfig.load(
+        return load_config(
             self.cwd,
             environment=None if ignore_environment else self.environment,
-            max_inherit_depth=inherit_depth
+            inherit_depth=inherit_depth
             if inherit_depth is not None
             else self.inherit_depth,
-            load_imports=True,
-            search_paths=YAPENV_CONFIG_FILES + self.extra_config_file,
+            env_file=self.env_file_path,
+            extra_config_files=self.extra_config_file,
+            import_requirements=import_requirements,
         )
 
-        if import_requirements:
-            config.load_requirements()
-
-        if config.env_file is not None:
-            env_file = resolve_path(config.env_file)
-            if os.path.isfile(env_file):
-                yapenv_log.debug("Loading environment variables from: " + env_file)
-                load_dotenv(env_file)
-
-        return config
-
     @classmethod
     def decorator(cls, long_args_only=False):
+        opts = _COMMON_OPTS_LONG_ONLY if long_args_only else _COMMON_OPTS
+
         def apply(fn):
-            opts = []
-            opts += [
-                click.option(
-                    "--cwd",
-                    "--source-path",
-                    help="Execute yapenv from this path (Current working directory)",
-                    default=os.curdir,
-                ),
-                click.option(
-                    *(
-                        [
-                            "-e",
-                            "--env",
-                            "--environment",
-                        ]
-                        if not long_args_only
-                        else ["--environment"]
-                    ),
-                    help="Name of the extra environment config to load",
-                    default=None,
-                ),
-                click.option(
-                    "--extra-config-file",
-                    help="Either the config file or a glob pattern config file.",
-                    default=None,
-                    multiple=True,
-                ),
-                click.option(
-                    "--env-file",
-                    help="The yapenv environment local env file",
-                    default=".env",
-                ),
-                click.option(
-                    "--inherit-depth",
-                    help="Max number of config parents to inherit (0 to disable, -1 inf)",
-                    default=None,
-                    type=int,
-                ),
-                click.option(
-                    "--full-errors", help="Show full python errors", is_flag=True
-                ),
-                click.option(
-                    "--ignore-missing-env",
-                    help="Do not throw error if environment was not found",
-                    is_flag=True,
-                    default=False,
-                ),
-            ]
             for opt in opts:
                 fn = opt(fn)
             return fn
@@ -126,45 +75,137 @@ class CommonOptions(dict):
         return apply
 
 
-class FormatOptions(dict):
-    @property
-    def no_quote(self) -> bool:
-        return self.get("no_quote", False)
+class FormatOptions:
+    """The output format cli options, read from the command kwargs"""
 
-    @property
-    def format(self) -> PrintFormat:
-        return self.get("format", PrintFormat.cli)
+    __slots__ = ("no_quote", "format")
+
+    def __init__(self, kwargs: Dict[str, Any] = {}):
+        self.no_quote: bool = kwargs.get("no_quote", False)
+        self.format: PrintFormat = kwargs.get("format", PrintFormat.cli)
 
     def print(self, val: Union[list, dict], quote: bool = None):
+        from yapenv.format import get_print_formatted
+
         quote = not self.no_quote if quote is None else quote
         return get_print_formatted(self.format, val, quote)
 
+    def write(
+        self,
+        val: Union[list, dict, Iterable],
+        quote: bool = None,
+        stream: IO = None,
+    ):
+        """Write the formatted value (and a newline) to the stream (default stdout),
+        without building the full output string. Chunks are written in batches of
+        up to _WRITE_BATCH_SIZE chars (a line buffered tty flushes on each write)."""
+        from yapenv.format import iter_print_formatted
+
+        quote = not self.no_quote if quote is None else quote
+        stream = stream or sys.stdout
+        batch = []
+        batch_size = 0
+        for chunk in iter_print_formatted(self.format, val, quote):
+            batch.append(chunk)
+            batch_size += len(chunk)
+            if batch_size >= _WRITE_BATCH_SIZE:
+                stream.write("".join(batch))
+                batch.clear()
+                batch_size = 0
+        batch.append("\n")
+        stream.write("".join(batch))
+
     @classmethod
     def decorator(
         cls, default_format: PrintFormat = PrintFormat.cli, allow_quote: bool = True
     ):
-        def apply(*args):
-            opts = [
-                click.option(
-                    "--format",
-                    help=f"The document formate to print in ({', '.join(k.value for k in PrintFormat)})",
-                    type=PrintFormat,
-                    default=default_format,
-                ),
-            ]
-
-            if allow_quote:
-                opts.append(
-                    click.option(
-                        "--no-quote",
-                        help="Do not quote cli arguments",
-                        is_flag=True,
-                        default=False,
-                    )
-                )
+        opts = [_get_format_option(default_format)]
+        if allow_quote:
+            opts.append(_NO_QUOTE_OPT)
 
+        def apply(fn):
             for opt in opts:
-                fn = opt(*args)
+                fn = opt(fn)
             return fn
 
         return apply
+
+
+def _create_common_opts(long_args_only: bool = False):
+    return (
+        click.option(
+            "--cwd",
+            "--source-path",
+            help="Execute yapenv from this path (Current working directory)",
+            default=os.curdir,
+            type=click.Path(resolve_path=True),
+        ),
+        click.option(
+            *(
+                [
+                    "-e",
+                    "--env",
+                    "--environment",
+                ]
+                if not long_args_only
+                else ["--environment"]
+            ),
+            help="Name of the extra environment config to load",
+            default=None,
+        ),
+        click.option(
+            "--extra-config-file",
+            help="Either the config file or a glob pattern config file.",
+            default=None,
+            multiple=True,
+        ),
+        click.option(
+            "--env-file",
+            help="The yapenv environment local env file",
+            default=".env",
+            envvar="YAPENV_ENV_FILE",
+            type=click.Path(resolve_path=True),
+        ),
+        click.option(
+            "--inherit-depth",
+            help="Max number of config parents to inherit (0 to disable, -1 inf)",
+            default=None,
+            type=int,
+        ),
+        click.option("--full-errors", help="Show full python errors", is_flag=True),
+        click.option(
+            "--ignore-missing-env",
+            help="Do not throw error if environment was not found",
+            is_flag=True,
+            default=False,
+        ),
+    )
+
+
+# Click option decorators create a new parameter on each use, and so
+# can be built once and shared by all commands.
+_COMMON_OPTS = _create_common_opts()
+_COMMON_OPTS_LONG_ONLY = _create_common_opts(long_args_only=True)
+_NO_QUOTE_OPT = click.option(
+    "--no-quote",
+    help="Do not quote cli arguments",
+    is_flag=True,
+    default=False,
+)
+_FORMAT_OPTS: Dict[PrintFormat, Callable] = {}
+_FORMAT_HELP = (
+    "The document formate to print in ("
+    + ", ".join(k.value for k in PrintFormat)
+    + ")"
+)
+
+
+def _get_format_option(default_format: PrintFormat):
+    if default_format not in _FORMAT_OPTS:
+        _FORMAT_OPTS[default_format] = click.option(
+            "--format",
+            help=_FORMAT_HELP,
+            type=PrintFormat,
+            default=default_format,
+        )
+    return _FORMAT_OPTS[default_format]
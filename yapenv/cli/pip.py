@@ -1,7 +1,6 @@
 import click
 from typing import List
 
-import yapenv.commands as yapenv_commands
 from bole.format import PrintFormat
 from yapenv.cli.options import CommonOptions, FormatOptions
 from yapenv.cli.core import yapenv
@@ -21,11 +20,11 @@ def pip_command():
 @CommonOptions.decorator()
 @click.argument("packages", nargs=-1)
 def pip_args(packages: List[str], **kwargs):
+    import yapenv.commands as yapenv_commands
+
     config = CommonOptions(kwargs).load()
-    print(
-        FormatOptions(kwargs).print(
-            yapenv_commands.pip_command_args(config, requirements=packages), quote=False
-        )
+    FormatOptions(kwargs).write(
+        yapenv_commands.pip_command_args(config, requirements=packages), quote=False
     )
 
 
@@ -35,5 +34,7 @@ def pip_args(packages: List[str], **kwargs):
 @CommonOptions.decorator()
 @click.argument("packages", nargs=-1)
 def pip_install(packages: List[str], **kwargs):
+    import yapenv.commands as yapenv_commands
+
     config = CommonOptions(kwargs).load()
     yapenv_commands.pip_install(config, packages=packages)
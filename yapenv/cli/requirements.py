@@ -1,4 +1,4 @@
-import yapenv.commands as yapenv_commands
+from operator import attrgetter
 from bole.format import PrintFormat
 from yapenv.cli.options import CommonOptions, FormatOptions
 from yapenv.cli.core import yapenv
@@ -14,13 +14,16 @@ def requirements():
 @CommonOptions.decorator()
 def export(**kwargs):
     config = CommonOptions(kwargs).load()
-    packages = [r.package for r in config.requirements if r.package is not None]
-    print(FormatOptions(kwargs).print(packages))
+    requirements = config.requirements
+    packages = (p for p in map(attrgetter("package"), requirements) if p is not None)
+    FormatOptions(kwargs).write(packages)
 
 
 @requirements.command("freeze", help="Run pip freeze in the virtual env")
 @CommonOptions.decorator()
 def freeze(**kwargs):
-    config = CommonOptions(kwargs).load()
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
     config.load_virtualenv()
     yapenv_commands.handover(config, "pip", "freeze", use_source_dir=True)
@@ -1,7 +1,6 @@
 import click
 from typing import List
 
-import yapenv.commands as yapenv_commands
 from yapenv.cli.options import CommonOptions
 from yapenv.cli.core import yapenv
 
@@ -16,7 +15,9 @@ from yapenv.cli.core import yapenv
     default=False,
 )
 def shell(keep_current_directory: bool = False, **kwargs):
-    config = CommonOptions(kwargs).load()
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
     yapenv_commands.shell(config, use_source_dir=not keep_current_directory)
 
 
@@ -36,7 +37,9 @@ def shell(keep_current_directory: bool = False, **kwargs):
 def run(
     command: str, args: List[str] = [], keep_current_directory: bool = False, **kwargs
 ):
-    config = CommonOptions(kwargs).load()
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
     config.load_virtualenv()
     cmnd = [command] + list(args)
     yapenv_commands.handover(config, *cmnd, use_source_dir=not keep_current_directory)
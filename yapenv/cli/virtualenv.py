@@ -1,4 +1,3 @@
-import yapenv.commands as yapenv_commands
 from bole.format import PrintFormat
 from yapenv.cli.options import CommonOptions, FormatOptions
 from yapenv.cli.core import yapenv
@@ -15,12 +14,10 @@ def virtualenv_command():
 @FormatOptions.decorator(PrintFormat.cli, allow_quote=False)
 @CommonOptions.decorator()
 def virtualenv_args(**kwargs):
-    config = CommonOptions(kwargs).load()
-    print(
-        FormatOptions(kwargs).print(
-            yapenv_commands.virtualenv_args(config), quote=False
-        )
-    )
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
+    FormatOptions(kwargs).write(yapenv_commands.virtualenv_args(config), quote=False)
 
 
 @virtualenv_command.command(
@@ -28,5 +25,7 @@ def virtualenv_args(**kwargs):
 )
 @CommonOptions.decorator()
 def virtualenv_create(**kwargs):
-    config = CommonOptions(kwargs).load()
+    import yapenv.commands as yapenv_commands
+
+    config = CommonOptions(kwargs).load(import_requirements=False)
     yapenv_commands.virtualenv_create(config)
@@ -1,12 +1,19 @@
-import json
+import copy
+import logging
 import shutil
+from functools import lru_cache
 from typing import List
-import yaml
 import sys
 from yapenv.log import yapenv_log
 from yapenv.consts import YAPENV_CONFIG_FILES
 from yapenv.config import YAPENVConfig
-from yapenv.utils import deep_merge, resolve_template, touch
+from yapenv.utils import (
+    SafeYamlDumper,
+    confirm,
+    deep_merge_dicts,
+    resolve_template,
+    touch_files,
+)
 from yapenv.commands.virtualenv import virtualenv_create
 from yapenv.commands.pip import pip_install
 
@@ -18,9 +25,7 @@ def check_delete_environment(config: YAPENVConfig, force: bool = False):
     yapenv_log.warning(
         "You are about to delete the virtual environment @ " + config.venv_path
     )
-    if input("WARNING: are you sure? (y/n) ") != "y":
-        return False
-    return True
+    return confirm("WARNING: are you sure? (y/n) ")
 
 
 def delete(config: YAPENVConfig, force: bool = False):
@@ -30,8 +35,10 @@ def delete(config: YAPENVConfig, force: bool = False):
         config (YAPENVConfig): The config
         force (bool, optional): Do not ask before deleting. Defaults to False.
     """
+    venv_path = config.venv_path
+
     # Check if running from within the virtual environment
-    if sys.executable.startswith(config.venv_path):
+    if sys.executable.startswith(venv_path):
         raise Exception("Cannot delete the currently executing virtual environment")
 
     # Check active virtual environment
@@ -39,13 +46,23 @@ def delete(config: YAPENVConfig, force: bool = False):
         if not check_delete_environment(config, force=force):
             yapenv_log.info("Aborted")
             return False
-        shutil.rmtree(config.venv_path)
-        yapenv_log.info("Delete virtual environment folder @ " + config.venv_path)
+        shutil.rmtree(venv_path)
+        yapenv_log.info("Delete virtual environment folder @ " + venv_path)
     else:
-        yapenv_log.warning("No virtual environment @ " + config.venv_path)
+        yapenv_log.warning("No virtual environment @ " + venv_path)
     return True
 
 
+@lru_cache(maxsize=8)
+def _load_template_config(template_name: str) -> dict:
+    """Helper: load a config template as dictionary (cached, do not modify)"""
+    return YAPENVConfig.load(
+        resolve_template(template_name),
+        max_inherit_depth=0,
+        load_imports=False,
+    ).to_dictionary()
+
+
 def init(
     active_config: YAPENVConfig,
     config_filename: str = None,
@@ -66,29 +83,20 @@ def init(
     """
     # Checking configuration
     to_merge: List[YAPENVConfig] = []
-    to_merge.append(
-        YAPENVConfig.load(
-            resolve_template("config.yaml"),
-            max_inherit_depth=0,
-            load_imports=False,
-        )
-    )
+    to_merge.append(copy.deepcopy(_load_template_config("config.yaml")))
     if add_requirement_files:
         to_merge.append(
-            YAPENVConfig.load(
-                resolve_template("config_with_requirements.yaml"),
-                max_inherit_depth=0,
-                load_imports=False,
-            )
+            copy.deepcopy(_load_template_config("config_with_requirements.yaml"))
         )
 
     if merge_with_current:
-        to_merge.append(active_config)
+        # deep_merge is in place, merge a copy of the active config.
+        to_merge.append(active_config.to_dictionary())
 
     if merge_with is not None:
         to_merge.append(merge_with)
 
-    init_config = YAPENVConfig(deep_merge({}, *to_merge))
+    init_config = YAPENVConfig(deep_merge_dicts({}, *to_merge))
     init_config.clean_requirements()
 
     init_config.python_version = python_version or init_config.get("python_version")
@@ -105,19 +113,28 @@ def init(
 
     config_filename = config_filename or YAPENV_CONFIG_FILES[0] or ".yapenv.yaml"
     config_filepath = active_config.resolve_from_source_directory(config_filename)
-    yapenv_log.debug(
-        "Initialing with config: \n" + yaml.safe_dump(init_config.to_dictionary())
-    )
-    with open(config_filepath, "w") as config_file:
+    import json
+    import yaml
+
+    config_dict = init_config.to_dictionary()
+    if yapenv_log.isEnabledFor(logging.DEBUG):
+        yapenv_log.debug(
+            "Initialing with config: \n"
+            + yaml.dump(config_dict, Dumper=SafeYamlDumper)
+        )
+    with open(config_filepath, "w", buffering=1 << 16) as config_file:
         if config_filename.endswith(".json"):
-            config_file.write(json.dumps(init_config.to_dictionary(), indent=2))
+            json.dump(config_dict, config_file, indent=2)
         else:
-            config_file.write(yaml.safe_dump(init_config.to_dictionary()))
+            yaml.dump(config_dict, config_file, Dumper=SafeYamlDumper)
         yapenv_log.info("Initialized config file @ " + config_filepath)
 
     if add_requirement_files:
-        touch(active_config.resolve_from_source_directory("requirements.txt"))
-        touch(active_config.resolve_from_source_directory("requirements.dev.txt"))
+        touch_files(
+            active_config.source_directory,
+            "requirements.txt",
+            "requirements.dev.txt",
+        )
         yapenv_log.info("Initialized requirement files")
 
 
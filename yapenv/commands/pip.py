@@ -1,17 +1,26 @@
+from itertools import chain
+from operator import attrgetter
 from typing import Union, List
 from yapenv.log import yapenv_log
-from yapenv.utils import run_python_module, clean_args, quote_no_expand_args
+from yapenv.utils import (
+    run_python_module,
+    clean_args,
+    quote_no_expand_args,
+)
 from yapenv.config import YAPENVConfig, YAPENVConfigRequirement
 
 
 def pip_command_args(
     config: YAPENVConfig,
     requirements: List[Union[str, dict, YAPENVConfigRequirement]] = [],
+    quote: bool = True,
 ):
     """Return the yapenv pip install args (for cli)
 
     Args:
         config (YAPENVConfig): The yapenv config.
+        quote (bool, optional): Shell quote the args. Defaults to True. If false,
+            the args are returned as is (see run_python_module expand_args).
     """
     requirements = (
         config.requirements
@@ -19,13 +28,14 @@ def pip_command_args(
         else [YAPENVConfigRequirement.parse(r) for r in requirements]
     )
 
-    return quote_no_expand_args(
-        *clean_args(
-            "install",
-            *config.pip_install_args,
-            *[r.package for r in requirements],
+    args = clean_args(
+        *chain(
+            ("install",),
+            config.pip_install_args,
+            map(attrgetter("package"), requirements),
         )
     )
+    return quote_no_expand_args(*args) if quote else list(args)
 
 
 def pip_install(config: YAPENVConfig, packages: List[str] = []):
@@ -39,6 +49,6 @@ def pip_install(config: YAPENVConfig, packages: List[str] = []):
     ), "No requirements found in config, cannot install."
     yapenv_log.info("Running pip install in venv @ " + config.venv_path)
     config.load_virtualenv()
-    cmnd = ["pip", *pip_command_args(config, requirements=packages)]
+    cmnd = ["pip", *pip_command_args(config, requirements=packages, quote=False)]
     yapenv_log.debug(str(cmnd))
-    run_python_module(*cmnd, use_venv=True)
+    run_python_module(*cmnd, use_venv=True, expand_args=True)
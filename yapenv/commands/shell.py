@@ -1,8 +1,9 @@
 import os
 from yapenv.commands.virtualenv import virtualenv_create
 from yapenv.config import YAPENVConfig
-from yapenv.consts import ENTRY_ENVS
+from yapenv.consts import get_entry_envs
 from yapenv.log import yapenv_log
+from yapenv.utils import confirm
 
 
 def handover(
@@ -28,7 +29,14 @@ def handover(
     command = list(command)
 
     yapenv_log.debug(f"Running: {command}")
-    os.execvpe(command[0], command, env=env or os.environ.copy())
+    # An empty (or no) env inherits the process envs.
+    if not os.path.isabs(command[0]):
+        # Search PATH for the executable.
+        os.execvpe(command[0], command, env or os.environ)
+    elif not env:
+        os.execv(command[0], command)
+    else:
+        os.execve(command[0], command, env)
 
 
 def shell(
@@ -46,7 +54,7 @@ def shell(
 
     if not config.has_virtual_environment():
         yapenv_log.warning("Virtual env not found")
-        if input("Create? (y/n)") != "y":
+        if not confirm("Create? (y/n) "):
             yapenv_log.info("Aborted")
             return
 
@@ -56,10 +64,9 @@ def shell(
     command = []
     if os.name != "nt":
         active_shell = active_shell or os.environ.get("SHELL", "sh")
-        yapenv_activate = config.resolve_from_venv_bin_directory(
-            "activate_yapenv_shell"
-        )
-        venv_activate = config.resolve_from_venv_bin_directory("activate")
+        bin_directory = config.resolve_from_venv_bin_directory()
+        yapenv_activate = os.path.join(bin_directory, "activate_yapenv_shell")
+        venv_activate = os.path.join(bin_directory, "activate")
         command = [active_shell, yapenv_activate, venv_activate, active_shell]
     else:
         config.load_virtualenv()
@@ -69,6 +76,6 @@ def shell(
     handover(
         config,
         *command,
-        env=ENTRY_ENVS,
+        env=get_entry_envs(),
         use_source_dir=use_source_dir,
     )
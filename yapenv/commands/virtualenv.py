@@ -1,5 +1,7 @@
 import os
 import shutil
+import hashlib
+from yapenv.consts import YAPENV_VERSION
 from yapenv.log import yapenv_log
 from yapenv.utils import (
     resolve_template,
@@ -11,29 +13,97 @@ from yapenv.utils import (
 from yapenv.config import YAPENVConfig
 
 
-def virtualenv_args(config: YAPENVConfig):
+def virtualenv_args(config: YAPENVConfig, quote: bool = True):
     """Returns the virtualenv args from the yapenv config
 
     Args:
         config (YAPENVConfig): The yapenv config.
+        quote (bool, optional): Shell quote the args. Defaults to True. If false,
+            the args are returned as is (see run_python_module expand_args).
     """
     args = clean_args(
         *option_or_empty("--python", config.python_executable or config.python_version),
         *config.virtualenv_args
     )
     return [
-        *quote_no_expand_args(*args),
+        *(quote_no_expand_args(*args) if quote else args),
         config.venv_path,
     ]
 
 
-def virtualenv_update_files(config: YAPENVConfig):
-    yapenv_log.info("Copying yapenv shell activation script")
-    shutil.copyfile(
-        resolve_template("activate_yapenv_shell"),
-        config.resolve_from_venv_bin_directory("activate_yapenv_shell"),
+def virtualenv_files_signature(config: YAPENVConfig) -> str:
+    """Returns a hash of the yapenv venv files inputs (see virtualenv_update_files)"""
+    template = resolve_template("activate_yapenv_shell")
+    template_stat = os.stat(template)
+    pip_config_path = (
+        config.resolve_from_source_directory(config.pip_config_path)
+        if config.pip_config_path is not None
+        else None
+    )
+    signature = (
+        YAPENV_VERSION,
+        template,
+        template_stat.st_mtime_ns,
+        template_stat.st_size,
+        pip_config_path,
+        pip_config_path is not None and os.path.isfile(pip_config_path),
     )
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+
+def virtualenv_update_files(config: YAPENVConfig, force: bool = False):
+    """Update the yapenv files in the virtual env (shell activation, pip config).
+    Skipped if the files were already updated with the same inputs.
+
+    Args:
+        config (YAPENVConfig): The yapenv config.
+        force (bool, optional): Update even if up to date. Defaults to False.
+    """
+    signature = virtualenv_files_signature(config)
+    signature_path = config.resolve_from_venv_directory(".yapenv_files.hash")
+    activate_path = config.resolve_from_venv_bin_directory("activate_yapenv_shell")
+    # The linked venv pip.conf (if the pip config exists) must also exist.
+    pip_config_link_path = (
+        config.resolve_from_venv_directory("pip.conf")
+        if config.pip_config_path is not None
+        and os.path.isfile(
+            config.resolve_from_source_directory(config.pip_config_path)
+        )
+        else None
+    )
+    if (
+        not force
+        and os.path.lexists(activate_path)
+        and (pip_config_link_path is None or os.path.lexists(pip_config_link_path))
+    ):
+        try:
+            with open(signature_path, "r", encoding="utf-8") as signature_file:
+                if signature_file.read() == signature:
+                    yapenv_log.debug("Virtual env yapenv files are up to date")
+                    return
+        except OSError:
+            pass
+
+    virtualenv_copy_shell_activation(config)
+    virtualenv_link_pip_config(config)
+
+    with open(signature_path, "w", encoding="utf-8") as signature_file:
+        signature_file.write(signature)
+
+
+def virtualenv_copy_shell_activation(config: YAPENVConfig):
+    """Copy the yapenv shell activation script into the virtual env"""
+    yapenv_log.info("Copying yapenv shell activation script")
+    src = resolve_template("activate_yapenv_shell")
+    dst = config.resolve_from_venv_bin_directory("activate_yapenv_shell")
+    # Remove first, so a (hard/sym) linked file is not written through.
+    if os.path.lexists(dst):
+        os.remove(dst)
+    shutil.copyfile(src, dst)
+
 
+def virtualenv_link_pip_config(config: YAPENVConfig):
+    """Link the config pip.conf (pip_config_path) into the virtual env"""
     # Removing old
     venv_config_path = config.resolve_from_venv_directory("pip.conf")
     if os.path.exists(venv_config_path):
@@ -62,10 +132,10 @@ def virtualenv_create(config: YAPENVConfig):
     """
     yapenv_log.debug("lasma")
     yapenv_log.info("Creating virtualenv @ " + config.venv_path)
-    cmnd = ["virtualenv", *virtualenv_args(config)]
+    cmnd = ["virtualenv", *virtualenv_args(config, quote=False)]
 
     yapenv_log.debug(" ".join(cmnd))
-    run_python_module(*cmnd, use_venv=False)
+    run_python_module(*cmnd, use_venv=False, expand_args=True)
 
     # Updating setup files.
     virtualenv_update_files(config)
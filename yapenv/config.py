@@ -1,13 +1,411 @@
 import re
 import os
+import stat
 import sys
-from typing import Union, List
-from bole.config import CascadingConfig, CascadingConfigDictionary, config_file_parser
-from yapenv.consts import YAPENV_CONFIG_FILES
-from yapenv.utils import resolve_path
+import glob
+import hashlib
+import copy
+import json
+import pickle
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple, Union, List
+from bole.config import CascadingConfig, CascadingConfigDictionary
+from bole.exceptions import BoleException
+from yapenv.consts import (
+    YAPENV_CACHE_DIR,
+    YAPENV_CONFIG_FILES,
+    YAPENV_VERSION,
+    get_entry_envs,
+    is_config_cache_disabled,
+)
+from yapenv.log import yapenv_log
+from yapenv.utils import (
+    _COLLECTION_ITEM_PART_RE,
+    clean_data_types,
+    read_file_bytes,
+    resolve_path,
+    stat_file,
+)
 
 
 REQUIREMENTS_COLLECTION_NAME = "requirements"
+_COMMENT_RE = re.compile(r"[#].*")
+_PKG_NAME_RE = re.compile(r"^[\w._-]+")
+
+_ACTIVE_VENV: Optional[Tuple[str, int]] = None
+"""The (path, mtime_ns) of the activate script last executed in this process"""
+
+FileSignature = Optional[Tuple[int, int, int]]
+"""The file (mtime_ns, size, inode), or None if missing"""
+FilesSignature = Tuple[Tuple[str, FileSignature], ...]
+ImportGlob = Tuple[str, bool]
+"""A config import glob pattern, as (absolute pattern, recursive)"""
+GlobsSignature = Tuple[Tuple[str, bool, Tuple[str, ...]], ...]
+
+_LOADED_CONFIG_CACHE: Dict[tuple, Tuple[FilesSignature, GlobsSignature, bytes]] = {}
+"""In memory cache of loaded configs, as (files signature, globs signature, pickled
+config)"""
+
+_CONFIG_CACHE_MAX_FILES = 256
+"""The max number of config cache files to keep in YAPENV_CACHE_DIR"""
+
+
+def config_file_parser(fpath: str, default_format: str = "yaml") -> dict:
+    """Parse a yapenv config file (yaml or json). Same as the bole config file parser,
+    but uses the libyaml loader if available. Parsed files are cached in memory by
+    (path, mtime, size, inode), and a copy is returned (not cached if
+    YAPENV_DISABLE_CONFIG_CACHE=true).
+
+    Args:
+        fpath (str): The path to the config file.
+        default_format (str, optional): The default format (if no known ext).
+            Defaults to "yaml".
+
+    Returns:
+        dict: The loaded config file.
+    """
+    if is_config_cache_disabled():
+        return read_config_file(os.path.abspath(fpath), default_format)
+    return parse_config_file(fpath, default_format)[0]
+
+
+def parse_config_file(
+    fpath: str, default_format: str = "yaml"
+) -> Tuple[dict, Tuple[int, int, int]]:
+    """Parse a yapenv config file (cached, see config_file_parser). The file is
+    stat-ed before it is read, so a change during the read invalidates the signature.
+
+    Returns:
+        Tuple[dict, Tuple[int, int, int]]: The (parsed config copy, file signature).
+    """
+    fpath = os.path.abspath(fpath)
+    file_stat = os.stat(fpath)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+    parsed = _parse_config_file(fpath, signature, default_format)
+    return copy.deepcopy(dict(parsed)), signature
+
+
+@lru_cache(maxsize=256)
+def _parse_config_file(
+    fpath: str, signature: Tuple[int, int, int], default_format: str
+):
+    """Helper: cached (read only) parse of the config file. The file signature
+    (mtime, size, inode) is part of the cache key, so changed or replaced files
+    are parsed again."""
+    return MappingProxyType(read_config_file(fpath, default_format, size=signature[1]))
+
+
+def read_config_file(
+    fpath: str, default_format: str = "yaml", size: int = None
+) -> dict:
+    """Read and parse a config file (yaml or json, no cache)"""
+    if fpath.endswith(".json"):
+        format = "json"
+    elif fpath.endswith((".yaml", ".yml")):
+        format = "yaml"
+    else:
+        format = default_format
+
+    assert format in ["yaml", "json"], ValueError(
+        "Could not find a supported format type for " + fpath
+    )
+
+    # Both parsers accept (utf-8) bytes, empty yaml documents are None.
+    data = read_file_bytes(fpath, size)
+    if format == "yaml":
+        import yaml
+        from yapenv.utils import SafeYamlLoader
+
+        as_dict = yaml.load(data, Loader=SafeYamlLoader)
+    else:
+        as_dict = json.loads(data) if data.strip() else None
+
+    if as_dict is None:
+        as_dict = {}
+
+    assert isinstance(as_dict, dict), BoleException(
+        "Configuration files must represent a dictionary @ " + fpath
+    )
+    return as_dict
+
+
+@lru_cache(maxsize=256)
+def read_requirements_file(fpath: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Returns the requirement lines of a requirements file, without comments and
+    empty lines. Cached by (path, mtime, size), e.g. for config reloads."""
+    data = read_file_bytes(fpath, size).decode("utf-8")
+    lines = []
+    for line in data.splitlines():
+        line = _COMMENT_RE.sub("", line).strip()
+        if len(line) > 0:
+            lines.append(line)
+    return tuple(lines)
+
+
+def get_file_mtime(fpath: str) -> int:
+    """Returns the file modified time (ns), or -1 if the file is missing"""
+    try:
+        return os.stat(fpath).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_file_signature(fpath: str) -> FileSignature:
+    """Returns the file (mtime_ns, size, inode), or None if the file is missing"""
+    try:
+        file_stat = os.stat(fpath)
+    except OSError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+
+
+def get_files_signature(filepaths: Iterable[str]) -> FilesSignature:
+    """Returns the (path, file signature) of the files (see get_file_signature).
+    Files are grouped by directory, and directories with multiple files are listed once
+    (see list_directory_files) so that only existing files are stat-ed."""
+    filepaths = list(filepaths)
+    by_directory: Dict[str, List[str]] = {}
+    for fpath in filepaths:
+        by_directory.setdefault(os.path.dirname(fpath), []).append(fpath)
+
+    signatures: Dict[str, FileSignature] = {}
+    for directory, dir_filepaths in by_directory.items():
+        signatures.update(get_directory_files_signatures(directory, dir_filepaths))
+
+    return tuple((fpath, signatures.get(fpath, None)) for fpath in filepaths)
+
+
+def get_directory_files_signatures(
+    directory: str, filepaths: List[str]
+) -> Dict[str, FileSignature]:
+    """Returns the file signatures of the (existing) files in the directory"""
+    if len(filepaths) == 1:
+        return {filepaths[0]: get_file_signature(filepaths[0])}
+
+    dir_mtime = get_file_mtime(directory)
+    if dir_mtime == -1:
+        return {}
+
+    try:
+        dir_files = list_directory_files(directory, dir_mtime)
+    except OSError:
+        # Cannot list the directory (permissions), check each file.
+        dir_files = None
+
+    return {
+        fpath: get_file_signature(fpath)
+        for fpath in filepaths
+        if dir_files is None or os.path.basename(fpath) in dir_files
+    }
+
+
+def get_globs_signature(globs: Iterable[ImportGlob]) -> GlobsSignature:
+    """Returns the (pattern, recursive, matched files) of the import glob patterns"""
+    return tuple(
+        (pattern, recursive, tuple(sorted(glob.glob(pattern, recursive=recursive))))
+        for pattern, recursive in dict.fromkeys(globs)
+    )
+
+
+def get_config_imports(fpath: str, config: dict) -> Tuple[List[str], List[ImportGlob]]:
+    """Returns the (file paths, glob patterns) imported by a parsed config file,
+    including the environment imports. Missing file imports are included."""
+    imports = list(_as_list(config.get("import", None)))
+    environments = config.get("environments", None)
+    if isinstance(environments, dict):
+        for env_config in environments.values():
+            if isinstance(env_config, dict):
+                imports += _as_list(env_config.get("import", None))
+
+    directory = os.path.dirname(fpath)
+    filepaths: List[str] = []
+    globs: List[ImportGlob] = []
+    for config_import in imports:
+        if isinstance(config_import, dict):
+            path = config_import.get("path", None)
+            recursive = config_import.get("recursive", None)
+        else:
+            path, recursive = config_import, None
+        if not isinstance(path, str) or len(path.strip()) == 0:
+            continue
+
+        import_path = resolve_path(path, root_directory=directory)
+        if "*" in import_path or "?" in import_path:
+            recursive = "**" in path if recursive is None else recursive is True
+            globs.append((import_path, recursive))
+        else:
+            filepaths.append(import_path)
+    return filepaths, globs
+
+
+def _as_list(val) -> list:
+    if val is None:
+        return []
+    return val if isinstance(val, list) else [val]
+
+
+@lru_cache(maxsize=256)
+def list_directory_files(directory: str, mtime_ns: int) -> FrozenSet[str]:
+    """Returns the names of the files in the directory. Cached by the directory
+    modified time, which changes when files are added or removed."""
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+def get_config_search_files(src: str, search_paths: List[str]) -> List[str]:
+    """Returns all the config file paths that would be searched when loading src (inherit walk)"""
+    src = os.path.abspath(src)
+    files = []
+    if os.path.isfile(src):
+        files.append(src)
+        src = os.path.dirname(src)
+
+    cur_path = src
+    while True:
+        for fn in search_paths:
+            files.append(fn if os.path.isabs(fn) else os.path.join(cur_path, fn))
+        parent_path = os.path.dirname(cur_path)
+        if parent_path == cur_path:
+            break
+        cur_path = parent_path
+
+    return list(dict.fromkeys(files))
+
+
+@lru_cache(maxsize=256)
+def compile_dict_path(path: str) -> Tuple[Union[str, int], ...]:
+    """Compile a dictionary path (e.g. 'a.b[0].c') to its dict keys and list indexes.
+
+    Differs from the bole config find (path parsed per step):
+        - Empty parts are ignored anywhere, e.g. 'a.b.' is 'a.b' (find does not
+          find paths with a trailing empty part).
+        - List indexes use the full number, e.g. 'a[10]' is item 10 (find reads
+          only the first digit).
+    """
+    steps = []
+    for part in path.split("."):
+        match = _COLLECTION_ITEM_PART_RE.match(part)
+        assert not match[2] or match[3], "Invalid item path part " + part
+        if match[1]:
+            steps.append(match[1])
+        if match[2]:
+            steps.append(int(match[3]))
+    return tuple(steps)
+
+
+def get_config_cache_filepath(key: tuple):
+    """Returns the on disk cache file path for a config cache key"""
+    key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return os.path.join(YAPENV_CACHE_DIR, f"config-{key_hash}.pkl")
+
+
+def is_private_cache_stat(cache_stat: os.stat_result) -> bool:
+    """True if the cache file/directory is owned by the current user and cannot be
+    written by others (group or other). Always true where there are no user ids."""
+    if not hasattr(os, "getuid"):
+        return True
+    return cache_stat.st_uid == os.getuid() and not (
+        cache_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def read_cached_config(key: tuple):
+    """Returns a copy of the cached config for key, or None if not cached or the
+    config files (or the files matched by the import globs) changed since it was cached.
+    """
+    entry = _LOADED_CONFIG_CACHE.get(key, None)
+    if entry is None:
+        try:
+            # The cache files are unpickled, only load private ones.
+            if not is_private_cache_stat(os.stat(YAPENV_CACHE_DIR)):
+                return None
+            with open(get_config_cache_filepath(key), "rb") as cache_file:
+                if not is_private_cache_stat(os.fstat(cache_file.fileno())):
+                    return None
+                entry = pickle.load(cache_file)
+        except Exception:
+            return None
+
+    signature, globs_signature, data = entry
+    if get_files_signature(
+        fpath for fpath, _ in signature
+    ) != signature or globs_signature != get_globs_signature(
+        (pattern, recursive) for pattern, recursive, _ in globs_signature
+    ):
+        _LOADED_CONFIG_CACHE.pop(key, None)
+        return None
+
+    _LOADED_CONFIG_CACHE[key] = entry
+    return pickle.loads(data)
+
+
+def write_cached_config(
+    key: tuple,
+    config: "YAPENVConfig",
+    files_signature: FilesSignature,
+    globs_signature: GlobsSignature = (),
+):
+    """Caches the config (in memory and on disk), invalidated when any of the files
+    change or the files matched by the import globs change. The signatures must be
+    taken before the files were parsed (see YAPENVConfig.load)."""
+    entry = (
+        files_signature,
+        globs_signature,
+        pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+    _LOADED_CONFIG_CACHE[key] = entry
+
+    cache_filepath = get_config_cache_filepath(key)
+    try:
+        # Private to the user, the cache files are unpickled (see read_cached_config).
+        os.makedirs(YAPENV_CACHE_DIR, mode=0o700, exist_ok=True)
+        if not is_private_cache_stat(os.stat(YAPENV_CACHE_DIR)):
+            yapenv_log.debug(
+                "Config cache disabled, cache dir is not private @ " + YAPENV_CACHE_DIR
+            )
+            return
+        temp_filepath = f"{cache_filepath}.{os.getpid()}.tmp"
+        cache_fd = os.open(temp_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(cache_fd, "wb") as cache_file:
+            pickle.dump(entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_filepath, cache_filepath)
+    except OSError as ex:
+        yapenv_log.debug(
+            "Could not write config cache @ " + cache_filepath + ": " + str(ex)
+        )
+        return
+
+    prune_config_cache()
+
+
+def prune_config_cache(max_files: int = _CONFIG_CACHE_MAX_FILES):
+    """Removes the least recently accessed config cache files, keeping max_files"""
+    try:
+        with os.scandir(YAPENV_CACHE_DIR) as entries:
+            cache_files = [
+                entry
+                for entry in entries
+                if entry.name.startswith("config-") and entry.name.endswith(".pkl")
+            ]
+    except OSError:
+        return
+
+    if len(cache_files) <= max_files:
+        return
+
+    def get_access_time(entry: os.DirEntry) -> int:
+        try:
+            return entry.stat().st_atime_ns
+        except OSError:
+            return -1
+
+    cache_files.sort(key=get_access_time)
+    for entry in cache_files[: len(cache_files) - max_files]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
 
 
 class YAPENVConfigRequirement(CascadingConfigDictionary):
@@ -33,28 +431,20 @@ class YAPENVConfigRequirement(CascadingConfigDictionary):
 
     @classmethod
     def unique(cls, requirements: List[Union["YAPENVConfigRequirement", dict]]):
-        """Removes duplicate requirements and validates a requirement list."""
-        requirements = [YAPENVConfigRequirement.parse(r) for r in requirements]
-        requirements.reverse()
-        cleaned = []
-        matched = set()
-        for r in requirements:
+        """Removes duplicate requirements and validates a requirement list.
+        The last occurrence of a requirement is kept (in its position)."""
+        cleaned: Dict[str, YAPENVConfigRequirement] = {}
+        for r in map(YAPENVConfigRequirement.parse, requirements):
             if r.import_path is not None:
                 pkg_name = "import: " + r.import_path
             else:
-                pkg_name = re.match(r"^[\w._-]+", r.package.strip())
-                if pkg_name is None:
-                    pkg_name = r.package
-                else:
-                    pkg_name = pkg_name[0]
-            if pkg_name in matched:
-                continue
-            matched.add(pkg_name)
-            cleaned.append(r)
+                pkg_name = _PKG_NAME_RE.match(r.package.strip())
+                pkg_name = r.package if pkg_name is None else pkg_name[0]
+            # Re-insert to move to the last occurrence position.
+            cleaned.pop(pkg_name, None)
+            cleaned[pkg_name] = r
 
-        cleaned.reverse()
-
-        return cleaned
+        return list(cleaned.values())
 
 
 class YAPENVConfig(CascadingConfig):
@@ -66,6 +456,51 @@ class YAPENVConfig(CascadingConfig):
     to the location of the config file.
     """
 
+    __venv_path: Tuple[Tuple[str, str], str] = None
+    """Internal. The cached (directories key, venv_path) pair, see venv_path"""
+
+    __venv_bin_path: Tuple[str, str] = None
+    """Internal. The cached (venv_path, bin path) pair, see venv_bin_path"""
+
+    def to_dictionary(self) -> dict:
+        """Convert this config to a dictionary (json data types, copied)"""
+        return clean_data_types(self)
+
+    def find_many(self, paths: Iterable[str]) -> List[Any]:
+        """Search the config for multiple dictionary paths (see find). Each path is
+        compiled once and walked directly (no parsing per step). See compile_dict_path
+        for the path differences from find (trailing empty parts, list indexes).
+
+        Args:
+            paths (Iterable[str]): The dictionary paths, e.g. ['a.b[0].c']
+
+        Returns:
+            List[Any]: The values that were found.
+        """
+        missing = object()
+        found = []
+        for path in paths:
+            steps = compile_dict_path(path)
+            if len(steps) == 0:
+                continue
+            val = self
+            for step in steps:
+                if isinstance(step, int):
+                    assert isinstance(
+                        val, list
+                    ), f"{path} references a list value but parent is not a list"
+                    val = val[step] if step < len(val) else missing
+                else:
+                    assert isinstance(
+                        val, dict
+                    ), f"{path} references a dict value but parent is not a dict"
+                    val = val.get(step, missing)
+                if val is missing:
+                    break
+            if val is not missing:
+                found.append(val)
+        return found
+
     @property
     def env_file(self) -> str:
         return self.get("env_file", ".env")
@@ -86,9 +521,17 @@ class YAPENVConfig(CascadingConfig):
     @property
     def venv_path(self) -> str:
         """The path to the virtual environment"""
-        if os.path.isabs(self.venv_directory):
-            return self.venv_directory
-        return os.path.abspath(os.path.join(self.source_directory, self.venv_directory))
+        cache_key = (self.source_directory, self.venv_directory)
+        if self.__venv_path is not None and self.__venv_path[0] == cache_key:
+            return self.__venv_path[1]
+
+        venv_directory = cache_key[1]
+        if not os.path.isabs(venv_directory):
+            venv_directory = os.path.abspath(
+                os.path.join(self.source_directory, venv_directory)
+            )
+        self.__venv_path = (cache_key, venv_directory)
+        return venv_directory
 
     @property
     def venv_local_folder_path(self) -> str:
@@ -117,10 +560,14 @@ class YAPENVConfig(CascadingConfig):
     @property
     def requirements(self) -> List[YAPENVConfigRequirement]:
         """A list of pip requirements"""
-        self[REQUIREMENTS_COLLECTION_NAME] = YAPENVConfigRequirement.parse_list(
-            self.get(REQUIREMENTS_COLLECTION_NAME, [])
-        )
-        return self[REQUIREMENTS_COLLECTION_NAME]
+        requirements = self.get(REQUIREMENTS_COLLECTION_NAME, None)
+        # Parse only if not already parsed.
+        if not isinstance(requirements, list) or any(
+            not isinstance(r, YAPENVConfigRequirement) for r in requirements
+        ):
+            requirements = YAPENVConfigRequirement.parse_list(requirements or [])
+            self[REQUIREMENTS_COLLECTION_NAME] = requirements
+        return requirements
 
     def has_virtual_environment(self) -> dict:
         """True if a virtual environment exists"""
@@ -137,18 +584,32 @@ class YAPENVConfig(CascadingConfig):
             else self.venv_path,
         )
 
-    def resolve_from_venv_bin_directory(self, *parts: List[str]):
-        """Resolves a script from the bin directory"""
+    @property
+    def venv_bin_path(self) -> str:
+        """The path to the virtual environment bin (scripts) folder.
+        Cached once found, for the current venv_path."""
+        venv_path = self.venv_path
+        if self.__venv_bin_path is not None and self.__venv_bin_path[0] == venv_path:
+            return self.__venv_bin_path[1]
+
         possible_bin_folders = ["bin", "Scripts"]
-        bin_fldr = None
+        bin_path = None
         for fldr in possible_bin_folders:
-            if os.path.exists(self.resolve_from_venv_directory(fldr)):
-                bin_fldr = fldr
+            fldr_path = self.resolve_from_venv_directory(fldr)
+            if os.path.exists(fldr_path):
+                bin_path = fldr_path
                 break
-        assert bin_fldr is not None, FileNotFoundError(
+        assert bin_path is not None, FileNotFoundError(
             f"Bin folder was not found (searched for {possible_bin_folders})"
         )
-        return self.resolve_from_venv_directory(bin_fldr, *parts)
+        self.__venv_bin_path = (venv_path, bin_path)
+        return bin_path
+
+    def resolve_from_venv_bin_directory(self, *parts: List[str]):
+        """Resolves a script from the bin directory"""
+        if len(parts) == 0:
+            return self.venv_bin_path
+        return resolve_path(*parts, root_directory=self.venv_bin_path)
 
     def resolve_from_source_directory(self, *parts: List[str]):
         """Resolve path with the source directory as root path"""
@@ -181,16 +642,13 @@ class YAPENVConfig(CascadingConfig):
                     self.resolve_from_source_directory(req.import_path)
                 )
 
-                if os.path.isfile(abs_import_path):
-                    with open(abs_import_path, "r", encoding="utf-8") as req_file:
-                        requirements_raw = req_file.read()
-
-                    # Clean comments
-                    requirements_raw = re.sub(r"[#].*", "", requirements_raw)
-                    for req_as_str in requirements_raw.split("\n"):
-                        req_as_str = req_as_str.strip()
-                        if len(req_as_str) == 0:
-                            continue
+                req_file_stat = stat_file(abs_import_path)
+                if req_file_stat is not None:
+                    for req_as_str in read_requirements_file(
+                        abs_import_path,
+                        req_file_stat.st_mtime_ns,
+                        req_file_stat.st_size,
+                    ):
                         resolved_requirements.append(
                             YAPENVConfigRequirement.parse(req_as_str)
                         )
@@ -203,17 +661,24 @@ class YAPENVConfig(CascadingConfig):
 
     def load_virtualenv(self):
         """Loads the virtual environment into python (using activate.py)."""
-        import importlib.util
-
+        global _ACTIVE_VENV
         import_path = self.resolve_from_venv_bin_directory("activate_this.py")
-        assert os.path.isfile(import_path), (
+        loaded_key = (import_path, get_file_mtime(import_path))
+        # activate_this sets VIRTUAL_ENV to the parent of the bin directory.
+        venv_path = os.path.dirname(os.path.dirname(import_path))
+        if loaded_key == _ACTIVE_VENV and os.environ.get("VIRTUAL_ENV") == venv_path:
+            # Still the active venv in this process (and not recreated since).
+            return
+
+        assert loaded_key[1] != -1 and os.path.isfile(import_path), (
             "Virtual env not found or virtualenv invalid @ " + self.venv_path
         )
-        spec = importlib.util.spec_from_file_location(
-            re.sub(r"[^\w]+", "_", import_path), import_path
-        )
-        foo = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(foo)
+        with open(import_path, "r") as activate_file:
+            code = compile(activate_file.read(), import_path, "exec")
+        # Keep the entry envs before changing the process envs.
+        get_entry_envs()
+        exec(code, {"__file__": import_path})
+        _ACTIVE_VENV = loaded_key
 
     def clean_requirements(self):
         """Clean the requirement list for all environments and remove duplicates"""
@@ -251,17 +716,103 @@ class YAPENVConfig(CascadingConfig):
         max_inherit_depth: int = -1,
         load_imports: bool = True,
         search_paths: List[str] = YAPENV_CONFIG_FILES,
-        parse_config=config_file_parser,
+        parse_config=None,
         clean_requirements: bool = True,
     ):
+        """Loads the yapenv configuration from a source path. Results are cached (in memory and in
+        YAPENV_CACHE_DIR) and invalidated when any of the searched, loaded or imported
+        config files (or the files matched by import globs) change.
+        Set YAPENV_DISABLE_CONFIG_CACHE=true to disable the cache.
+        """
         max_inherit_depth = max_inherit_depth if max_inherit_depth is not None else -1
+        # The cli --cwd is already resolved by click (no-op for absolute paths).
+        src = os.path.abspath(src)
+
+        # Custom parsers cannot be identified in the cache key.
+        if parse_config is not None or is_config_cache_disabled():
+            return cls.__load(
+                src,
+                environment,
+                max_inherit_depth,
+                load_imports,
+                search_paths,
+                parse_config,
+                clean_requirements,
+            )
+
+        cache_key = (
+            YAPENV_VERSION,
+            cls.__module__,
+            cls.__qualname__,
+            src,
+            environment,
+            max_inherit_depth,
+            load_imports,
+            tuple(search_paths),
+            clean_requirements,
+        )
+
+        config = read_cached_config(cache_key)
+        if config is not None:
+            return config
+
+        # The files are stat-ed before they are parsed, so changes made while loading
+        # invalidate the cached config.
+        files_signature: Dict[str, FileSignature] = dict(
+            get_files_signature(get_config_search_files(src, search_paths))
+        )
+        globs_signature: Dict[ImportGlob, tuple] = {}
+
+        def parse_and_track_config(fpath: str, *args, **kwargs):
+            parsed, signature = parse_config_file(fpath, *args, **kwargs)
+            files_signature.setdefault(os.path.abspath(fpath), signature)
+            # Imports may be missing or globs (new files are not parsed).
+            import_files, globs = get_config_imports(fpath, parsed)
+            for import_file in import_files:
+                if import_file not in files_signature:
+                    files_signature[import_file] = get_file_signature(import_file)
+            new_globs = [g for g in globs if g not in globs_signature]
+            for pattern, recursive, matched in get_globs_signature(new_globs):
+                globs_signature[(pattern, recursive)] = (pattern, recursive, matched)
+            return parsed
+
+        config = cls.__load(
+            src,
+            environment,
+            max_inherit_depth,
+            load_imports,
+            search_paths,
+            parse_and_track_config,
+            clean_requirements,
+        )
+
+        write_cached_config(
+            cache_key,
+            config,
+            tuple(files_signature.items()),
+            tuple(globs_signature.values()),
+        )
+
+        return config
+
+    @classmethod
+    def __load(
+        cls,
+        src: str,
+        environment: str,
+        max_inherit_depth: int,
+        load_imports: bool,
+        search_paths: List[str],
+        parse_config,
+        clean_requirements: bool,
+    ):
         config = super().load(
             src,
             environment,
             max_inherit_depth,
             load_imports,
             search_paths,
-            parse_config,
+            parse_config or config_file_parser,
         )
 
         if clean_requirements:
@@ -1,15 +1,52 @@
 import os
 import re
 
-ENTRY_ENVS = os.environ.copy()
-YAPENV_CONFIG_FILES = re.split(
-    r"[\s,]+",
-    os.environ.get(
-        "YAPENV_CONFIG_FILES", ".yapenv.yaml .yapenv.yml .yapenv .yapenv.json"
+_SEP_RE = re.compile(r"[\s,]+")
+YAPENV_CONFIG_FILES = tuple(
+    _SEP_RE.split(
+        os.environ.get(
+            "YAPENV_CONFIG_FILES", ".yapenv.yaml .yapenv.yml .yapenv .yapenv.json"
+        ),
+    )
+)
+YAPENV_CACHE_DIR = os.environ.get(
+    "YAPENV_CACHE_DIR",
+    os.path.join(
+        os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        ),
+        "yapenv",
     ),
 )
 
 
+def is_config_cache_disabled():
+    """If true, do not cache loaded configurations"""
+    return os.environ.get("YAPENV_DISABLE_CONFIG_CACHE", "false").strip().lower() in [
+        "true",
+        "1",
+    ]
+
+
+_ENTRY_ENVS: dict = None
+
+
+def get_entry_envs() -> dict:
+    """Returns a copy of the process envs as they were on entry (copied on first call).
+    Call before modifying the process envs (env files, virtualenv activation)."""
+    global _ENTRY_ENVS
+    if _ENTRY_ENVS is None:
+        _ENTRY_ENVS = os.environ.copy()
+    return _ENTRY_ENVS
+
+
+def __getattr__(name: str):
+    # Lazy ENTRY_ENVS (backwards compatible).
+    if name == "ENTRY_ENVS":
+        return get_entry_envs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_version():
     """Return the yapenv version"""
     version_path = os.path.join(os.path.dirname(__file__), ".version")
@@ -21,3 +58,6 @@ def get_version():
 
 YAPENV_VERSION = get_version()
 __version__ = YAPENV_VERSION
+YAPENV_GROUP_HELP = (
+    f"Yet Another Python Environment manager (version: {YAPENV_VERSION})"
+)
@@ -0,0 +1,72 @@
+import json
+from typing import Iterable, Iterator, Union
+from bole.format import PrintFormat
+
+
+def print_list_value(v) -> str:
+    """Returns the printed value of a list/cli item (collections as json)"""
+    if isinstance(v, (list, dict)):
+        return json.dumps(v)
+    return str(v)
+
+
+def iter_print_formatted(
+    format: PrintFormat,
+    val: Union[list, dict, Iterable],
+    quote_cli: bool = True,
+) -> Iterator[str]:
+    """Yields the value printed in the provided format, as string chunks.
+    Same output as the bole get_print_formatted, using the libyaml dumper if available.
+    list/cli formats consume iterables lazily, yaml/json collect them into a list.
+
+    Args:
+        format (PrintFormat): The format to print in
+        val (Union[list, dict, Iterable]): The value to print
+        quote_cli (bool, optional): If true, quote cli arguments. Defaults to True.
+
+    Yields:
+        str: The printed value chunks.
+    """
+    if format == PrintFormat.list or format == PrintFormat.cli:
+        if isinstance(val, dict):
+            val = (v for item in val.items() for v in item)
+
+        seperator = "\n" if format == PrintFormat.list else " "
+        quote = None
+        if quote_cli and format == PrintFormat.cli:
+            from shlex import quote
+
+        for idx, v in enumerate(val):
+            if idx > 0:
+                yield seperator
+            yield quote(print_list_value(v)) if quote else print_list_value(v)
+        return
+
+    if not isinstance(val, (list, dict)):
+        val = list(val)
+
+    if format == PrintFormat.yaml:
+        import yaml
+        from yapenv.utils import SafeYamlDumper
+
+        yield yaml.dump(val, Dumper=SafeYamlDumper)
+    else:
+        yield from json.JSONEncoder().iterencode(val)
+
+
+def get_print_formatted(
+    format: PrintFormat,
+    val: Union[list, dict],
+    quote_cli: bool = True,
+) -> str:
+    """Return the value printed in the provided format (see iter_print_formatted)
+
+    Args:
+        format (PrintFormat): The format to print in
+        val (Union[list, dict]): The value to print
+        quote_cli (bool, optional): If true, quote cli arguments. Defaults to True.
+
+    Returns:
+        str: The printed value in the format.
+    """
+    return "".join(iter_print_formatted(format, val, quote_cli))
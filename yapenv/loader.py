@@ -0,0 +1,86 @@
+import os
+from typing import Dict, List, Tuple
+from yapenv.consts import YAPENV_CONFIG_FILES, get_entry_envs
+from yapenv.log import yapenv_log
+from yapenv.utils import resolve_path, stat_file
+
+_ENV_FILE_CACHE: Dict[Tuple[str, int, int], Dict[str, str]] = {}
+"""Parsed (not interpolated) env files by (path, mtime_ns, size)"""
+
+
+def load_env_file(env_file: str, file_stat: os.stat_result = None):
+    """Load the env file values into os.environ (existing values are not overridden),
+    same as dotenv.load_dotenv. The parsed values are cached by the file path,
+    modified time and size, and interpolated when applied (existing envs first)."""
+    from dotenv import dotenv_values
+    from dotenv.main import resolve_variables
+
+    file_stat = file_stat or os.stat(env_file)
+    cache_key = (env_file, file_stat.st_mtime_ns, file_stat.st_size)
+    if cache_key not in _ENV_FILE_CACHE:
+        _ENV_FILE_CACHE[cache_key] = dotenv_values(env_file, interpolate=False)
+
+    # Keep the entry envs before changing the process envs.
+    get_entry_envs()
+    values = resolve_variables(_ENV_FILE_CACHE[cache_key].items(), override=False)
+    for key, val in values.items():
+        if val is not None:
+            os.environ.setdefault(key, val)
+
+
+def load_config(
+    cwd: str,
+    environment: str = None,
+    inherit_depth: int = None,
+    env_file: str = None,
+    extra_config_files: List[str] = [],
+    import_requirements: bool = True,
+):
+    """Load the yapenv config with its env files, as the cli commands do
+    (see CommonOptions). Does not depend on the cli (click).
+
+    Args:
+        cwd (str): The source path to load from.
+        environment (str, optional): The extra environment config. Defaults to None.
+        inherit_depth (int, optional): Max number of config parents to inherit.
+            Defaults to None (all).
+        env_file (str, optional): The env file, loaded before the config. Defaults to
+            YAPENV_ENV_FILE or .env.
+        extra_config_files (List[str], optional): Extra config files. Defaults to [].
+        import_requirements (bool, optional): Load the requirement files.
+            Defaults to True.
+
+    Returns:
+        YAPENVConfig: The loaded config.
+    """
+    from yapenv.config import YAPENVConfig
+
+    env_file = env_file or os.environ.get("YAPENV_ENV_FILE", ".env")
+    env_file = env_file if os.path.isabs(env_file) else resolve_path(env_file)
+    env_file_stat = stat_file(env_file)
+    if env_file_stat is not None:
+        yapenv_log.debug("Loading environment variables from: " + env_file)
+        load_env_file(env_file, env_file_stat)
+
+    config = YAPENVConfig.load(
+        cwd,
+        environment=environment,
+        max_inherit_depth=inherit_depth,
+        load_imports=True,
+        search_paths=[*YAPENV_CONFIG_FILES, *extra_config_files],
+    )
+
+    if import_requirements:
+        config.load_requirements()
+
+    if config.env_file is not None:
+        config_env_file = resolve_path(config.env_file)
+        # Skip if already loaded above.
+        config_env_file_stat = (
+            stat_file(config_env_file) if config_env_file != env_file else None
+        )
+        if config_env_file_stat is not None:
+            yapenv_log.debug("Loading environment variables from: " + config_env_file)
+            load_env_file(config_env_file, config_env_file_stat)
+
+    return config
@@ -2,37 +2,69 @@ import glob
 import json
 import os
 import re
-import subprocess
+import stat
 import sys
-import shlex
-from typing import List, Union
+from collections import deque
+from functools import lru_cache
+from typing import List, Optional, Union
 from shutil import which
 from yapenv.log import yapenv_log
 
+try:
+    # Prefer the libyaml (C) implementation when available.
+    from yaml import CSafeLoader as SafeYamlLoader, CSafeDumper as SafeYamlDumper
+except ImportError:
+    from yaml import (  # noqa: F401
+        SafeLoader as SafeYamlLoader,
+        SafeDumper as SafeYamlDumper,
+    )
+
 
 def option_or_empty(key, val):
     """Return a key/value option if val is not None"""
     if val is None:
-        return []
-    return [key, val]
+        return ()
+    return (key, val)
 
 
 def clean_args(*args: str):
-    """Clean arguments for empty/null values"""
-    args = [str(a) for a in args if a is not None and len(str(a)) > 0]
-    return args
+    """Clean arguments for empty/null values (returns a generator)"""
+    return (a for a in (str(a) for a in args if a is not None) if len(a) > 0)
+
+
+_LEADING_SPACE_RE = re.compile(r"[\s]")
+_READ_CHUNK_SIZE = 64 * 1024
 
 
 def quote_no_expand_args(*args: str):
     """Quote arguments that have no spaces/tabs/newlines in them"""
+    import shlex
+
     quoted = []
     for a in args:
-        if re.match(r"[\s]", a) is None:
+        if _LEADING_SPACE_RE.match(a) is None:
             a = shlex.quote(a)
         quoted.append(a)
     return quoted
 
 
+def has_no_expand_args(*args: str) -> bool:
+    """True if any of the arguments has a leading space/tab/newline, and should be
+    split and expanded by the shell (see quote_no_expand_args)"""
+    return any(_LEADING_SPACE_RE.match(a) is not None for a in args)
+
+
+def confirm(prompt: str) -> bool:
+    """Prompt the user (stdin) for a y/n answer. Returns true if answered y.
+    Raises EOFError if stdin is closed (same as input())."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    answer = sys.stdin.readline()
+    if len(answer) == 0:
+        raise EOFError("No answer, stdin was closed")
+    return answer.strip() == "y"
+
+
 def touch(fname):
     """Touch a file (like in unix)"""
     if os.path.exists(fname):
@@ -41,8 +73,63 @@ def touch(fname):
         open(fname, "a").close()
 
 
+def stat_file(fpath: str) -> Optional[os.stat_result]:
+    """Returns the file stat, or None if not found or not a regular file"""
+    try:
+        file_stat = os.stat(fpath)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
+def read_file_bytes(fpath: str, size: int = None) -> bytes:
+    """Read the file content (bytes), until the end of the file.
+
+    Args:
+        fpath (str): The file path.
+        size (int, optional): The expected file size (st_size), used as the first
+            read size. Defaults to fstat.
+    """
+    fd = os.open(fpath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        read_size = os.fstat(fd).st_size if size is None else size
+        chunks = []
+        # Reads may be partial, or the file may have grown since the stat.
+        while True:
+            chunk = os.read(fd, read_size or _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            read_size = _READ_CHUNK_SIZE
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def touch_files(directory: str, *names: str):
+    """Touch files in a directory (like in unix). The directory is opened once and
+    the files are resolved relative to it (where dir_fd is supported)."""
+    if os.open not in os.supports_dir_fd or os.utime not in os.supports_fd:
+        for name in names:
+            touch(os.path.join(directory, name))
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for name in names:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            fd = os.open(name, flags, 0o666, dir_fd=dir_fd)
+            try:
+                os.utime(fd)
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+
+
+@lru_cache(maxsize=32)
 def resolve_template(*path: str):
-    """Resolve a tempate give path args"""
+    """Resolve a tempate give path args (cached, the templates folder is fixed)"""
     return resolve_path(
         *path,
         root_directory=os.path.join(os.path.dirname(__file__), "templates"),
@@ -72,7 +159,11 @@ def resolve_path(*path_parts: str, root_directory: str = None):
 
 def deep_merge(target: Union[dict, list], *sources):
     """Merge dictionaries and lists into a single object.
-    Lists values are concatenated
+    Lists values are concatenated.
+
+    NOTE: The merge is done in place. Values that are missing in the target are
+    assigned as is (not copied), and may be modified by the merge of later sources.
+    Pass copies if the sources must not change.
 
     Args:
         target (Union[dict, list]): The target to merge into.
@@ -83,25 +174,32 @@ def deep_merge(target: Union[dict, list], *sources):
         )
         # List merges as concat, and dose not merge the internal values.
         for src in sources:
-            target += src
+            target.extend(src)
         return target
 
     if isinstance(target, dict):
         assert all(isinstance(src, dict) for src in sources), (
             "Merge target and source must be of the same type (dict)",
         )
+        deep_merge_dicts(target, *sources)
+    return target
 
-        for src in sources:
-            for key in src.keys():
-                if key not in target:
-                    target[key] = src[key]
-                    continue
-                if isinstance(src[key], list) and isinstance(target[key], list):
-                    target[key] = deep_merge([], target[key], src[key])
-                elif isinstance(src[key], dict) and isinstance(target[key], dict):
-                    target[key] = deep_merge({}, target[key], src[key])
-                else:
-                    target[key] = src[key]
+
+def deep_merge_dicts(target: dict, *sources: dict):
+    """Same as deep_merge, for dictionaries only (the args are not type checked).
+    Nested dictionaries are merged using a work queue (no recursion)."""
+    pending = deque((target, src) for src in sources)
+    while pending:
+        merge_target, src = pending.popleft()
+        for key, val in src.items():
+            current = merge_target.get(key)
+            if isinstance(val, list) and isinstance(current, list):
+                current.extend(val)
+            elif isinstance(val, dict) and isinstance(current, dict):
+                # Merges into the same target are queued in the source order.
+                pending.append((current, val))
+            else:
+                merge_target[key] = val
     return target
 
 
@@ -113,6 +211,7 @@ def run_python_module(
     include_process_envs: bool = True,
     executable: str = None,
     use_venv: bool = True,
+    expand_args: bool = False,
 ):
     if executable is None:
         if (
@@ -132,6 +231,7 @@ def run_python_module(
         envs=envs,
         throw_errors=throw_errors,
         include_process_envs=include_process_envs,
+        expand_args=expand_args,
     )
 
 
@@ -140,12 +240,14 @@ def run_shell_command(
     envs: dict = {},
     throw_errors: bool = True,
     include_process_envs: bool = True,
+    expand_args: bool = False,
 ):
     return run_shell_commands(
         [cmnd],
         envs=envs,
         throw_errors=throw_errors,
         include_process_envs=include_process_envs,
+        expand_args=expand_args,
     )
 
 
@@ -155,27 +257,38 @@ def run_shell_commands(
     envs: dict = {},
     throw_errors: bool = True,
     include_process_envs: bool = True,
+    expand_args: bool = False,
 ):
-    # Compose the command
-    shell_command = []
-    is_first = True
-    for cmnd in commands:
-        if not is_first:
-            shell_command.append(seperator)
-        is_first = False
-        for part in cmnd:
-            shell_command.append(part)
-
-    run_env = os.environ.copy() if include_process_envs else {}
-    run_env.update(envs or {})
-
-    yapenv_log.debug(" ".join(shell_command))
-
-    rslt = subprocess.run(
-        " ".join(shell_command),
-        shell=True,
-        env=run_env,
-    )
+    """Run shell commands. The command args must not be shell quoted. A single command
+    is executed directly (no shell), multiple commands are quoted (shlex.join), joined
+    by the seperator and executed in a shell.
+
+    If expand_args, args with a leading space are not quoted, and are split and
+    expanded by the shell (see quote_no_expand_args). Commands with such args are
+    always executed in a shell.
+    """
+    import shlex
+    import subprocess
+
+    # None = inherit the process envs
+    run_env = None
+    if not include_process_envs or envs:
+        run_env = os.environ.copy() if include_process_envs else {}
+        run_env.update(envs or {})
+
+    def join_command(cmnd) -> str:
+        if expand_args:
+            return " ".join(quote_no_expand_args(*cmnd))
+        return shlex.join(cmnd)
+
+    if len(commands) == 1 and not (expand_args and has_no_expand_args(*commands[0])):
+        command = list(commands[0])
+        yapenv_log.debug(shlex.join(command))
+        rslt = subprocess.run(command, shell=False, env=run_env)
+    else:
+        shell_command = f" {seperator} ".join(join_command(cmnd) for cmnd in commands)
+        yapenv_log.debug(shell_command)
+        rslt = subprocess.run(shell_command, shell=True, env=run_env)
 
     if throw_errors and rslt.returncode != 0:
         raise subprocess.SubprocessError(rslt.stderr)
@@ -184,10 +297,21 @@ def run_shell_commands(
 
 
 def clean_data_types(val):
+    """Converts a data object to json data structure (list,dict,value)"""
+    if val is None or isinstance(val, (str, bool, int, float)):
+        return val
+    if isinstance(val, dict):
+        return {
+            k if isinstance(k, str) else json.dumps(k): clean_data_types(v)
+            for k, v in val.items()
+        }
+    if isinstance(val, (list, tuple)):
+        return [clean_data_types(v) for v in val]
     return json.loads(json.dumps(val))
 
 
 COLLECTION_ITEM_PART_REGEX = r"^(.*?)(\[([0-9]*)\]|)$"
+_COLLECTION_ITEM_PART_RE = re.compile(COLLECTION_ITEM_PART_REGEX)
 
 
 def get_collection_path(val: Union[dict, list], path: Union[str, List[str]]):
@@ -212,7 +336,7 @@ def get_collection_path(val: Union[dict, list], path: Union[str, List[str]]):
         return None
 
     cur_item = path[0]
-    item_parts = re.match(COLLECTION_ITEM_PART_REGEX, cur_item)
+    item_parts = _COLLECTION_ITEM_PART_RE.match(cur_item)
     assert (
         item_parts is not None
     ), f"item parts must match the regex '{COLLECTION_ITEM_PART_REGEX}'"